@@ -1,6 +1,20 @@
 import re
 
+from unified_query_maker.models.where_model import (  # noqa: F401
+    AndExpression,
+    FilterExpressionModel,  # resolves the forward refs of the subclasses below
+    NotExpression,
+)
+
 
 def squash_ws(s: str) -> str:
     """Normalize whitespace for stable string comparisons."""
     return re.sub(r"\s+", " ", s).strip()
+
+
+class TaggedAnd(AndExpression):
+    """User-defined node subclass; translators must treat it as an And."""
+
+
+class TaggedNot(NotExpression):
+    """User-defined node subclass; translators must treat it as a Not."""
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import json
+from datetime import date
+
+import pytest
+
+from unified_query_maker import cache
+from unified_query_maker.cache import LRUCache, canonical_key
+from unified_query_maker.models import UQLQuery
+from unified_query_maker.translators.base import _PLAN_CACHE, clear_plan_cache
+from unified_query_maker.translators.elasticsearch_translator import (
+    ElasticsearchTranslator,
+)
+from unified_query_maker.translators.mongodb_translator import MongoDBTranslator
+from unified_query_maker.translators.postgresql_translator import PostgreSQLTranslator
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache: LRUCache[int] = LRUCache(max_size=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1  # "b" is now the oldest entry
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+
+def test_lru_cache_rejects_non_positive_size():
+    with pytest.raises(ValueError):
+        LRUCache(max_size=0)
+
+
+def test_canonical_key_ignores_dict_order_and_skips_non_json():
+    assert canonical_key({"from": "t", "limit": 1}) == canonical_key(
+        {"limit": 1, "from": "t"}
+    )
+    assert canonical_key({"value": True}) != canonical_key({"value": 1})
+    assert canonical_key({"value": date(2024, 1, 1)}) is None
+    assert canonical_key({"value": float("nan")}) is None
+    assert canonical_key({"value": [None, float("inf")]}) is None
+    assert canonical_key({"v": [{"w": (1, float("-inf"))}]}) is None
+    assert canonical_key({"value": None}) is not None
+    assert canonical_key(None) is not None
+
+
+def test_canonical_key_without_orjson(monkeypatch):
+    monkeypatch.setattr(cache, "orjson", None)
+    assert canonical_key({"from": "t", "limit": 1}) == canonical_key(
+        {"limit": 1, "from": "t"}
+    )
+    assert canonical_key({"value": float("nan")}) is None
+
+
+def test_sql_translate_reuses_cached_plan():
+    clear_plan_cache()
+    tr = PostgreSQLTranslator()
+    uql = {
+        "from": "t",
+        "where": {
+            "must": [{"type": "condition", "field": "a", "operator": "eq", "value": 1}]
+        },
+    }
+    first = tr.translate(uql)
+    assert len(_PLAN_CACHE) == 1
+    assert tr.translate(dict(reversed(list(uql.items())))) is first
+
+    sql, params = tr.translate_with_params(uql)
+    params.append("mutated")
+    assert tr.translate_with_params(uql) == (sql, [1])
+
+
+def test_sql_translate_does_not_cache_invalid_queries():
+    clear_plan_cache()
+    tr = PostgreSQLTranslator()
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            tr.translate({"from": "bad-name"})
+    assert len(_PLAN_CACHE) == 0
+
+
+def test_elasticsearch_translate_and_translate_json_share_one_entry():
+    clear_plan_cache()
+    tr = ElasticsearchTranslator()
+    uql = {"from": "idx", "limit": 3}
+    out = tr.translate(uql)
+    body = tr.translate_json(uql)
+    assert len(_PLAN_CACHE) == 1
+    assert json.loads(body) == out
+
+
+def test_mongodb_translate_returns_independent_cached_copies():
+    clear_plan_cache()
+    tr = MongoDBTranslator()
+    uql = {
+        "from": "c",
+        "where": {
+            "must": [
+                {"type": "condition", "field": "a", "operator": "in", "value": [1]}
+            ]
+        },
+        "orderBy": [{"field": "a", "order": "DESC"}],
+    }
+    first = tr.translate(uql)
+    first["filter"]["a"]["$in"].append(2)
+    second = tr.translate(uql)
+    assert len(_PLAN_CACHE) == 1
+    assert second == {"filter": {"a": {"$in": [1]}}, "sort": [("a", -1)]}
+
+
+def test_mongodb_translate_and_translate_json_share_one_entry():
+    clear_plan_cache()
+    tr = MongoDBTranslator()
+    uql = {"from": "c", "orderBy": [{"field": "a"}], "limit": 3}
+    out = tr.translate(uql)
+    body = tr.translate_json(uql)
+    assert len(_PLAN_CACHE) == 1
+    assert json.loads(body) == {"filter": {}, "sort": [["a", 1]], "limit": 3}
+    assert out["sort"] == [("a", 1)]
+
+
+def test_mutating_outputs_does_not_leak_into_other_translations():
+    clear_plan_cache()
+    uql = {
+        "select": ["a", "b"],
+        "from": "t",
+        "where": {"type": "condition", "field": "x", "operator": "in", "value": [1, 2]},
+    }
+    expected = PostgreSQLTranslator().translate(uql)
+    clear_plan_cache()
+
+    es = ElasticsearchTranslator().translate(uql)
+    es["_source"].append("secret")
+    es["query"]["bool"]["filter"][0]["terms"]["x"].append(999)
+    mongo = MongoDBTranslator().translate(uql)
+    mongo["filter"]["x"]["$in"].append(999)
+
+    assert PostgreSQLTranslator().translate(uql) == expected
+    assert MongoDBTranslator().translate(uql) == {
+        "filter": {"x": {"$in": [1, 2]}},
+        "projection": {"a": 1, "b": 1},
+    }
+
+
+def test_mutating_outputs_does_not_touch_the_input_model():
+    q = UQLQuery.model_validate(
+        {
+            "select": ["a"],
+            "from": "t",
+            "where": {
+                "type": "condition",
+                "field": "x",
+                "operator": "in",
+                "value": [1, 2],
+            },
+        }
+    )
+    before = q.model_dump()
+
+    es = ElasticsearchTranslator().translate(q)
+    es["_source"].append("secret")
+    es["query"]["bool"]["filter"][0]["terms"]["x"].append(999)
+    mongo = MongoDBTranslator().translate(q)
+    mongo["filter"]["x"]["$in"].append(999)
+
+    assert q.model_dump() == before
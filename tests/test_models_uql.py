@@ -12,7 +12,10 @@ def test_uqlquery_accepts_from_alias():
 
 
 def test_uqlquery_select_star_rules():
-    UQLQuery.model_validate({"select": ["*"], "from": "t"})
+    q1 = UQLQuery.model_validate({"select": ["*"], "from": "t"})
+    q2 = UQLQuery.model_validate({"select": ["*"], "from": "t"})
+    q1.select.append("x")
+    assert q2.select == ["*"]
 
     with pytest.raises(ValidationError):
         UQLQuery.model_validate({"select": ["*", "id"], "from": "t"})
@@ -1,11 +1,27 @@
 from __future__ import annotations
 
-from unified_query_maker.models.where_model import Condition, Operator, Where
+import json
+import sys
+
+import pytest
+
+from unified_query_maker.models import UQLQuery
+from unified_query_maker.models.where_model import (
+    AndExpression,
+    Condition,
+    NotExpression,
+    Operator,
+    Where,
+)
 from unified_query_maker.translators.elasticsearch_translator import (
+    ElasticsearchConditionTranslator,
     ElasticsearchQueryBuilder,
     ElasticsearchTranslator,
+    _ARRAY_CONTAINED_SOURCE,
 )
 
+from .conftest import TaggedAnd, TaggedNot
+
 
 def test_elasticsearch_translator_typed_conditions():
     tr = ElasticsearchTranslator()
@@ -35,8 +51,8 @@ def test_elasticsearch_translator_typed_conditions():
     assert out["size"] == 10
     assert out["from"] == 20
     assert out["sort"] == [{"age": {"order": "desc"}}]
-    assert "bool" in out["query"]
-    assert "must" in out["query"]["bool"]
+    assert out["query"]["bool"]["filter"] == [{"range": {"age": {"gt": 30}}}]
+    assert "must" not in out["query"]["bool"]
     assert "must_not" in out["query"]["bool"]
 
 
@@ -85,5 +101,266 @@ def test_elasticsearch_contains_escapes_wildcard_metacharacters():
             "where": {"must": [Where.field("name").contains(r"a*b?c\d")]},
         }
     )
-    clause = out["query"]["bool"]["must"][0]
+    clause = out["query"]["bool"]["filter"][0]
     assert clause == {"wildcard": {"name": "*a\\*b\\?c\\\\d*"}}
+
+
+def test_elasticsearch_translate_json_matches_translate_and_is_cached():
+    tr = ElasticsearchTranslator()
+    uql = {
+        "from": "idx",
+        "where": {"must": [Where.field("name").eq("Zoë")]},
+        "limit": 5,
+    }
+    # Condition instances are not plain JSON: serialized but not cached.
+    assert json.loads(tr.translate_json(uql)) == tr.translate(uql)
+
+    plain = {
+        "from": "idx",
+        "where": {
+            "type": "condition",
+            "field": "name",
+            "operator": "eq",
+            "value": "Zoë",
+        },
+    }
+    body = tr.translate_json(plain)
+    assert json.loads(body) == tr.translate(plain)
+    assert "Zoë".encode() in body
+    assert tr.translate_json(plain) is body
+
+
+def test_elasticsearch_translator_accepts_validated_model():
+    uql = {
+        "from": "idx",
+        "where": {"type": "condition", "field": "a", "operator": "gt", "value": 1},
+        "limit": 3,
+    }
+    model = UQLQuery.model_validate(uql)
+    assert ElasticsearchTranslator().translate(model) == (
+        ElasticsearchTranslator().translate(uql)
+    )
+
+
+def test_elasticsearch_ilike_converts_like_wildcards_and_escapes():
+    clause = ElasticsearchTranslator().translate(
+        {"from": "idx", "where": Where.field("name").ilike("a%b_\\%c*?\\")}
+    )["query"]["bool"]["filter"][0]
+    assert clause == {
+        "wildcard": {"name": {"value": "a*b?%c\\*\\?\\\\", "case_insensitive": True}}
+    }
+
+
+def test_elasticsearch_negations_are_fused_into_enclosing_must_not():
+    out = ElasticsearchTranslator().translate(
+        {
+            "from": "idx",
+            "where": {
+                "must": [
+                    Where.field("a").eq(1),
+                    Where.field("b").neq(2),
+                    Where.and_(Where.field("c").nin([3]), Where.field("d").gt(4)),
+                ],
+                "must_not": [Where.field("e").eq(5)],
+            },
+        }
+    )
+    assert out["query"] == {
+        "bool": {
+            "must": [
+                {"term": {"a": 1}},
+                {
+                    "bool": {
+                        "must": [{"range": {"d": {"gt": 4}}}],
+                        "must_not": [{"terms": {"c": [3]}}],
+                    }
+                },
+            ],
+            "must_not": [{"term": {"e": 5}}, {"term": {"b": 2}}],
+        }
+    }
+
+
+def test_elasticsearch_cached_translation_returns_independent_dicts():
+    tr = ElasticsearchTranslator()
+    uql = {
+        "from": "idx",
+        "where": {"type": "condition", "field": "a", "operator": "eq", "value": 1},
+    }
+    first = tr.translate(uql)
+    first["query"]["bool"]["must"].append({"term": {"x": 0}})
+    first["size"] = 99
+
+    second = tr.translate(uql)
+    assert second == {"query": {"bool": {"must": [{"term": {"a": 1}}]}}}
+    assert tr.translate(uql) is not second
+
+
+def test_elasticsearch_translate_many_matches_translate():
+    tr = ElasticsearchTranslator()
+    uqls = [
+        {"from": "idx"},
+        {"from": "idx", "where": Where.field("a").eq(1), "limit": 2},
+        UQLQuery.model_validate({"from": "idx", "select": ["a"]}),
+    ]
+    assert tr.translate_many(uqls) == [tr.translate(u) for u in uqls]
+
+    with pytest.raises(ValueError, match="Invalid UQL query"):
+        tr.translate_many([{"from": "idx"}, {"from": "idx", "limit": -1}])
+
+
+def test_elasticsearch_flattens_nested_and_or_and_unwraps_single_children():
+    a, b, c = (Where.field(f).eq(1) for f in "abc")
+    visitor = ElasticsearchConditionTranslator()
+
+    assert Where.and_(a).accept(visitor) == {"term": {"a": 1}}
+    assert Where.or_(Where.or_(a)).accept(visitor) == {"term": {"a": 1}}
+    assert Where.and_(a, Where.and_(b, c)).accept(visitor) == {
+        "bool": {"must": [{"term": {"a": 1}}, {"term": {"b": 1}}, {"term": {"c": 1}}]}
+    }
+    assert Where.or_(Where.or_(a, b), Where.and_(c)).accept(visitor) == {
+        "bool": {
+            "should": [{"term": {"a": 1}}, {"term": {"b": 1}}, {"term": {"c": 1}}],
+            "minimum_should_match": 1,
+        }
+    }
+
+
+def test_elasticsearch_wildcard_fields_target_wildcard_subfield():
+    uql = {
+        "from": "idx",
+        "where": {
+            "must": [
+                {
+                    "type": "condition",
+                    "field": "msg",
+                    "operator": "ends_with",
+                    "value": "x",
+                },
+                {
+                    "type": "condition",
+                    "field": "msg",
+                    "operator": "ncontains",
+                    "value": "y",
+                },
+                {"type": "condition", "field": "msg", "operator": "eq", "value": "z"},
+                {
+                    "type": "condition",
+                    "field": "other",
+                    "operator": "contains",
+                    "value": "w",
+                },
+            ]
+        },
+    }
+    plain = ElasticsearchTranslator().translate(uql)["query"]["bool"]
+    assert plain["filter"][0] == {"wildcard": {"msg": "*x"}}
+
+    routed = ElasticsearchTranslator(wildcard_fields={"msg"}).translate(uql)
+    b = routed["query"]["bool"]
+    assert b["filter"] == [
+        {"wildcard": {"msg.wildcard": "*x"}},
+        {"wildcard": {"other": "*w*"}},
+    ]
+    assert b["must"] == [{"term": {"msg": "z"}}]
+    assert b["must_not"] == [{"wildcard": {"msg.wildcard": "*y*"}}]
+
+
+def test_elasticsearch_deeply_nested_filters_do_not_recurse():
+    expr = Where.field("a").eq(1)
+    for i in range(sys.getrecursionlimit()):
+        expr = Where.or_(Where.not_(expr), Where.field("b").eq(i))
+
+    clause = ElasticsearchConditionTranslator().walk(expr)
+    for _ in range(sys.getrecursionlimit()):
+        clause = clause["bool"]["should"][0]["bool"]["must_not"][0]
+    assert clause == {"term": {"a": 1}}
+
+
+def test_elasticsearch_merges_compatible_ranges_on_the_same_field():
+    out = ElasticsearchTranslator().translate(
+        {
+            "from": "idx",
+            "where": {
+                "must": [
+                    Where.field("price").gt(10),
+                    Where.field("price").lte(100),
+                    Where.field("price").gte(5),
+                    Where.field("age").between(1, 2),
+                    Where.and_(Where.field("x").lt(3), Where.field("x").gt(1)),
+                ]
+            },
+        }
+    )
+    b = out["query"]["bool"]
+    assert b["filter"] == [
+        {"range": {"price": {"gt": 10, "lte": 100}}},
+        {"range": {"price": {"gte": 5}}},
+        {"range": {"age": {"gte": 1, "lte": 2}}},
+    ]
+    assert b["must"] == [{"range": {"x": {"lt": 3, "gt": 1}}}]
+
+
+def test_elasticsearch_folds_constant_clauses_from_empty_lists():
+    t = ElasticsearchTranslator()
+
+    def query(**where):
+        return t.translate({"from": "idx", "where": where})["query"]
+
+    assert query(must=[Where.field("a").in_([])]) == {"match_none": {}}
+    assert query(must=[Where.field("a").nin([]), Where.field("b").eq(1)]) == {
+        "bool": {"must": [{"term": {"b": 1}}]}
+    }
+    assert query(must_not=[Where.field("a").nin([])]) == {"match_none": {}}
+    assert query(must_not=[Where.field("a").in_([])]) == {"match_all": {}}
+    assert query(
+        must=[Where.or_(Where.field("a").in_([]), Where.field("b").eq(1))]
+    ) == {"bool": {"must": [{"term": {"b": 1}}]}}
+    assert query(
+        must=[Where.and_(Where.field("a").in_([]), Where.field("b").eq(1))]
+    ) == {"match_none": {}}
+
+
+def test_elasticsearch_array_contained_can_use_a_stored_script():
+    uql = {
+        "from": "idx",
+        "where": {"must": [Where.field("tags").array_contained(["a"])]},
+    }
+
+    inline = ElasticsearchTranslator().translate(uql)
+    assert "source" in inline["query"]["bool"]["must"][0]["script"]["script"]
+
+    t = ElasticsearchTranslator(array_contained_script_id="uql_ac")
+    assert t.translate(uql)["query"]["bool"]["must"] == [
+        {
+            "script": {
+                "script": {"id": "uql_ac", "params": {"allowed": ["a"], "f": "tags"}}
+            }
+        }
+    ]
+
+    calls = []
+
+    class FakeClient:
+        def put_script(self, **kwargs):
+            calls.append(kwargs)
+
+    t.register_scripts(FakeClient())
+    assert calls == [
+        {
+            "id": "uql_ac",
+            "script": {"lang": "painless", "source": _ARRAY_CONTAINED_SOURCE},
+        }
+    ]
+    with pytest.raises(ValueError):
+        ElasticsearchTranslator().register_scripts(FakeClient())
+
+
+def test_subclassed_filter_nodes_translate_like_builtins():
+    a, b = Where.field("a").eq(1), Where.field("b").eq(2)
+    plain = AndExpression(expressions=[a, NotExpression(expression=b)])
+    tagged = TaggedAnd(expressions=[a, TaggedNot(expression=b)])
+    tr = ElasticsearchTranslator()
+    assert tr.translate({"from": "t", "where": {"must": [tagged]}}) == tr.translate(
+        {"from": "t", "where": {"must": [plain]}}
+    )
@@ -1,7 +1,20 @@
 from __future__ import annotations
 
-from unified_query_maker.models.where_model import Condition, Operator, Where
-from unified_query_maker.translators.mongodb_translator import MongoDBTranslator
+import sys
+
+from unified_query_maker.models.where_model import (
+    AndExpression,
+    Condition,
+    NotExpression,
+    Operator,
+    Where,
+)
+from unified_query_maker.translators.mongodb_translator import (
+    MongoDBConditionTranslator,
+    MongoDBTranslator,
+)
+
+from .conftest import TaggedAnd, TaggedNot
 
 
 def test_mongodb_translator_typed_conditions():
@@ -58,3 +71,124 @@ def test_mongodb_translator_where_model_geo_and_exists():
     assert "$and" in f
     # must_not should appear as a $nor clause inside the $and list
     assert any("$nor" in part for part in f["$and"])
+
+
+def test_mongodb_translator_flattens_same_connectives():
+    a, b, c = (Where.field(n).eq(1) for n in "abc")
+    out = MongoDBTranslator().translate(
+        {
+            "from": "x",
+            "where": {
+                "must": [
+                    Where.and_(a, Where.and_(b, c)),
+                    Where.or_(a, Where.or_(b, c)),
+                    Where.not_(Where.or_(a, b)),
+                ]
+            },
+        }
+    )
+    assert out["filter"] == {
+        "$and": [
+            {"a": 1},
+            {"b": 1},
+            {"c": 1},
+            {"$or": [{"a": 1}, {"b": 1}, {"c": 1}]},
+            {"$nor": [{"a": 1}, {"b": 1}]},
+        ]
+    }
+
+
+def test_mongodb_translator_orders_conjunction_cheapest_first():
+    out = MongoDBTranslator().translate(
+        {
+            "from": "x",
+            "where": {
+                "must": [
+                    Where.field("name").contains("bob"),
+                    Where.field("age").gt(3),
+                    Where.field("a").exists(),
+                    Where.field("status").eq("active"),
+                    Where.field("b").gt(1),
+                ]
+            },
+        }
+    )
+    assert out["filter"]["$and"] == [
+        {"status": "active"},
+        {"age": {"$gt": 3}},
+        {"b": {"$gt": 1}},
+        {"a": {"$exists": True, "$ne": None}},
+        {"name": {"$regex": "bob"}},
+    ]
+
+
+def test_mongodb_translator_groups_must_not_into_one_nor():
+    out = MongoDBTranslator().translate(
+        {
+            "from": "x",
+            "where": {
+                "must_not": [
+                    Where.field("a").eq(1),
+                    Where.or_(Where.field("b").eq(2), Where.field("c").eq(3)),
+                ]
+            },
+        }
+    )
+    assert out["filter"] == {"$nor": [{"a": 1}, {"b": 2}, {"c": 3}]}
+
+
+def test_mongodb_translator_merges_same_field_equalities_into_in():
+    def filter_of(expr):
+        return MongoDBTranslator().translate({"from": "x", "where": expr})["filter"]
+
+    status = Where.field("status")
+    assert filter_of(
+        Where.or_(status.eq("a"), status.in_(["b", "c"]), status.eq(None))
+    ) == {"status": {"$in": ["a", "b", "c", None]}}
+    assert filter_of(Where.or_(status.eq("a"), Where.field("kind").eq("b"))) == {
+        "$or": [{"status": "a"}, {"kind": "b"}]
+    }
+    assert filter_of(Where.or_(status.eq("a"), status.gt("b"))) == {
+        "$or": [{"status": "a"}, {"status": {"$gt": "b"}}]
+    }
+
+
+def test_mongodb_translate_many_matches_translate():
+    tr = MongoDBTranslator()
+    uqls = [
+        {"from": "x", "where": Where.field("a").eq(1)},
+        {"from": "x", "orderBy": [{"field": "a", "order": "DESC"}], "limit": 2},
+    ]
+    assert tr.translate_many(uqls) == [tr.translate(u) for u in uqls]
+
+
+def test_mongodb_deeply_nested_filters_do_not_recurse():
+    expr = Where.field("a").eq(1)
+    for i in range(sys.getrecursionlimit()):
+        expr = Where.or_(Where.not_(expr), Where.field("b").eq(i))
+
+    # NOT (x OR b) folds into $nor [x's branches..., b], so levels nest as
+    # $nor -> $nor below the top-level $or.
+    doc = MongoDBConditionTranslator().walk(expr)
+    branches = doc["$or"][0]["$nor"]
+    for _ in range(sys.getrecursionlimit() - 1):
+        branches = branches[0]["$nor"]
+    assert branches == [{"a": 1}]
+
+
+def test_mongodb_translator_folds_double_not_and_single_child_nodes():
+    a = Where.field("a").eq(1)
+    walk = MongoDBConditionTranslator().walk
+    assert walk(Where.not_(Where.not_(a))) == {"a": 1}
+    assert walk(Where.and_(Where.or_(a))) == {"a": 1}
+    assert walk(Where.not_(Where.not_(Where.not_(a)))) == {"$nor": [{"a": 1}]}
+
+
+def test_subclassed_filter_nodes_translate_like_builtins():
+    a, b = Where.field("a").eq(1), Where.field("b").eq(2)
+    plain = AndExpression(expressions=[a, NotExpression(expression=b)])
+    tagged = TaggedAnd(expressions=[a, TaggedNot(expression=b)])
+    tr = MongoDBTranslator()
+    assert tr.translate({"from": "t", "where": {"must": [tagged]}}) == tr.translate(
+        {"from": "t", "where": {"must": [plain]}}
+    )
@@ -8,6 +8,7 @@ from unified_query_maker import (
     validate_uql_schema,
     validate_uql_semantics,
 )
+from unified_query_maker.translators.base import QueryTranslator
 
 
 def test_public_api_exports_are_importable():
@@ -21,3 +22,11 @@ def test_public_api_exports_are_importable():
     OracleTranslator()
     MongoDBTranslator()
     ElasticsearchTranslator()
+
+
+def test_custom_translator_translate_many_falls_back_to_translate():
+    class Upper(QueryTranslator):
+        def translate(self, query):
+            return query["from"].upper()
+
+    assert Upper().translate_many([{"from": "a"}, {"from": "b"}]) == ["A", "B"]
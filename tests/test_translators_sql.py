@@ -1,13 +1,22 @@
 from __future__ import annotations
 
+import sys
+
 import pytest
 
-from unified_query_maker.models.where_model import Where
+from unified_query_maker.models.where_model import (
+    AndExpression,
+    NotExpression,
+    OrExpression,
+    Where,
+)
+from unified_query_maker.translators.base_sql import SQLTranslator
 from unified_query_maker.translators.mssql_translator import MSSQLTranslator
 from unified_query_maker.translators.mysql_translator import MySQLTranslator
+from unified_query_maker.translators.oracle_translator import OracleTranslator
 from unified_query_maker.translators.postgresql_translator import PostgreSQLTranslator
 
-from .conftest import squash_ws
+from .conftest import TaggedAnd, TaggedNot, squash_ws
 
 
 def test_postgresql_translator_typed_conditions():
@@ -18,11 +27,26 @@ def test_postgresql_translator_typed_conditions():
             "from": "public.users",
             "where": {
                 "must": [
-                    {"type": "condition", "field": "age", "operator": "gt", "value": 30},
-                    {"type": "condition", "field": "active", "operator": "eq", "value": True},
+                    {
+                        "type": "condition",
+                        "field": "age",
+                        "operator": "gt",
+                        "value": 30,
+                    },
+                    {
+                        "type": "condition",
+                        "field": "active",
+                        "operator": "eq",
+                        "value": True,
+                    },
                 ],
                 "must_not": [
-                    {"type": "condition", "field": "status", "operator": "eq", "value": "inactive"}
+                    {
+                        "type": "condition",
+                        "field": "status",
+                        "operator": "eq",
+                        "value": "inactive",
+                    }
                 ],
             },
             "orderBy": [{"field": "name", "order": "DESC"}],
@@ -77,3 +101,139 @@ def test_mssql_translator_rejects_regex():
                 "where": {"must": [Where.field("name").regex(".*")]},
             }
         )
+
+
+def test_base_sql_translator_emits_identifiers_unquoted():
+    tr = SQLTranslator()
+    sql = tr.translate({"select": ["u.*", "o.total"], "from": "shop.orders"})
+    assert sql == "SELECT u.*, o.total FROM shop.orders;"
+
+
+def test_translate_with_params_binds_in_list_per_dialect():
+    uql = {
+        "select": ["id"],
+        "from": "t",
+        "where": {
+            "must": [
+                Where.field("a").eq(1),
+                Where.field("b").in_(["x", "y", "z"]),
+            ]
+        },
+    }
+    sql, params = PostgreSQLTranslator().translate_with_params(uql)
+    assert '"b" IN (%s, %s, %s)' in sql
+    assert params == [1, "x", "y", "z"]
+
+    sql, params = OracleTranslator().translate_with_params(uql)
+    assert '"a" = :1' in sql
+    assert '"b" IN (:2, :3, :4)' in sql
+    assert params == [1, "x", "y", "z"]
+
+    sql, _ = MSSQLTranslator().translate_with_params(uql)
+    assert "[b] IN (?, ?, ?)" in sql
+
+
+def test_escaped_identifiers_are_memoized_per_instance():
+    t = PostgreSQLTranslator()
+    assert t._escape_column_name("u.name") == '"u"."name"'
+    assert t._col_cache == {"u.name": '"u"."name"'}
+    assert t._escape_table_name("s.users") == '"s"."users"'
+    assert t._escape_column_name("u.name") == '"u"."name"'
+
+    with pytest.raises(ValueError):
+        t._escape_column_name("bad name")
+    assert "bad name" not in t._col_cache
+
+
+def test_string_literals_are_memoized_per_dialect():
+    pg, my = PostgreSQLTranslator(), MySQLTranslator()
+    assert pg._format_value("a\\'b") == "'a\\\\''b'"
+    assert my._format_value("a\\'b") == "'a\\''b'"
+    assert pg._format_value("a\\'b") == "'a\\\\''b'"
+    assert list(pg._str_cache) == ["a\\'b"]
+
+
+def test_deeply_nested_filters_do_not_recurse():
+    expr = Where.field("a").eq(1)
+    for i in range(sys.getrecursionlimit()):
+        expr = OrExpression(expressions=[NotExpression(expression=expr)])
+
+    sql = PostgreSQLTranslator().translate({"from": "t", "where": {"must": [expr]}})
+    assert sql.endswith('"a" = 1' + ")" * (2 * sys.getrecursionlimit() + 1) + ";")
+
+
+def test_sql_translate_many_matches_translate():
+    tr = MySQLTranslator()
+    uqls = [
+        {"from": "t", "where": Where.field("a").eq("x")},
+        {"select": ["a"], "from": "t", "limit": 2, "offset": 1},
+    ]
+    assert tr.translate_many(uqls) == [tr.translate(u) for u in uqls]
+
+
+def test_int_lists_render_like_mixed_lists():
+    pg = PostgreSQLTranslator()
+    assert pg._format_value([1, 2, 3]) == "(1, 2, 3)"
+    assert pg._format_value([1, True, "x"]) == "(1, TRUE, 'x')"
+
+
+def test_postgresql_array_literals_and_binds():
+    uql = {
+        "from": "t",
+        "where": {
+            "must": [
+                Where.field("a").array_overlap([1, 2]),
+                Where.field("b").array_contained([3, "x"]),
+            ]
+        },
+    }
+    sql = PostgreSQLTranslator().translate(uql)
+    assert '"a" && ARRAY[1, 2] AND "b" <@ ARRAY[3, \'x\']' in sql
+
+    sql, params = PostgreSQLTranslator().translate_with_params(uql)
+    assert '"a" && ARRAY[%s, %s] AND "b" <@ ARRAY[%s, %s]' in sql
+    assert params == [1, 2, 3, "x"]
+
+
+def test_subclassed_filter_nodes_render_like_builtins():
+    plain = AndExpression(
+        expressions=[
+            Where.field("a").eq(1),
+            NotExpression(expression=Where.field("b").eq(2)),
+        ]
+    )
+    tagged = TaggedAnd(
+        expressions=[
+            Where.field("a").eq(1),
+            TaggedNot(expression=Where.field("b").eq(2)),
+        ]
+    )
+    tr = PostgreSQLTranslator()
+    assert tr.translate({"from": "t", "where": {"must": [tagged]}}) == tr.translate(
+        {"from": "t", "where": {"must": [plain]}}
+    )
+
+
+def test_custom_identifier_quoting_is_applied_without_opt_in():
+    class Bracketed(SQLTranslator):
+        __slots__ = ()
+
+        def _escape_identifier(self, identifier: str) -> str:
+            return f"<{identifier}>"
+
+    sql = Bracketed().translate({"select": ["order", "u.x"], "from": "group"})
+    assert sql == "SELECT <order>, <u>.<x> FROM <group>;"
+
+
+def test_custom_positional_placeholders_are_numbered():
+    class Dollar(PostgreSQLTranslator):
+        __slots__ = ()
+
+        def _param_placeholder(self, index_1_based: int) -> str:
+            return f"${index_1_based}"
+
+    sql, params = Dollar().translate_with_params(
+        {"from": "t", "where": Where.field("a").in_([1, 2, 3])}
+    )
+    assert '"a" IN ($1, $2, $3)' in sql
+    assert params == [1, 2, 3]
@@ -1,5 +1,6 @@
 import pytest
 
+from unified_query_maker import utils
 from unified_query_maker.utils import escape_single_quotes, validate_qualified_name
 
 
@@ -20,6 +21,8 @@ def test_escape_single_quotes():
         ("bad-name", False, False, False),
         ("1bad", False, False, False),
         ("a..b", False, False, False),
+        ("caf\u00e9", False, False, False),
+        ("a.b ", False, False, True),
     ],
 )
 def test_validate_qualified_name(name, allow_star, allow_trailing_star, ok):
@@ -32,3 +35,15 @@ def test_validate_qualified_name(name, allow_star, allow_trailing_star, ok):
             validate_qualified_name(
                 name, allow_star=allow_star, allow_trailing_star=allow_trailing_star
             )
+
+
+def test_validate_qualified_name_rejects_repeated_invalid_input():
+    for _ in range(2):
+        validate_qualified_name("a.b", allow_star=False, allow_trailing_star=False)
+        with pytest.raises(ValueError):
+            validate_qualified_name("a b", allow_star=False, allow_trailing_star=False)
+
+
+def test_dumps_json_without_orjson(monkeypatch):
+    monkeypatch.setattr(utils, "orjson", None)
+    assert utils.dumps_json({"a": [1, "é"]}) == '{"a":[1,"é"]}'.encode()
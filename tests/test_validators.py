@@ -1,9 +1,18 @@
 from __future__ import annotations
 
-from unified_query_maker.models.where_model import AndExpression
+import sys
+
+from unified_query_maker.models.where_model import (
+    AndExpression,
+    NotExpression,
+    OrExpression,
+    Where,
+)
 from unified_query_maker.validators.schema_validator import validate_uql_schema
 from unified_query_maker.validators.semantic_validator import validate_uql_semantics
 
+from .conftest import TaggedAnd, TaggedNot
+
 
 def test_validate_uql_schema_valid_returns_model():
     q = validate_uql_schema({"select": ["id"], "from": "t"})
@@ -40,3 +49,21 @@ def test_validate_uql_semantics_detects_empty_and_expression():
     )
     assert q is not None
     assert validate_uql_semantics(q) is False
+
+
+def test_validate_uql_semantics_handles_deep_nesting():
+    expr = Where.field("a").eq(1)
+    for _ in range(sys.getrecursionlimit()):
+        expr = OrExpression(expressions=[NotExpression(expression=expr)])
+    q = validate_uql_schema({"from": "t", "where": {"must": [expr]}})
+    assert q is not None
+    assert validate_uql_semantics(q) is True
+
+
+def test_validate_uql_semantics_accepts_subclassed_nodes():
+    expr = TaggedAnd(
+        expressions=[TaggedNot(expression=Where.field("a").eq(1))],
+    )
+    q = validate_uql_schema({"from": "t", "where": {"must": [expr]}})
+    assert q is not None
+    assert validate_uql_semantics(q) is True
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import json
+import threading
+from collections import OrderedDict
+from math import isfinite
+from typing import Any, Generic, Hashable, List, Optional, TypeVar
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
+V = TypeVar("V")
+
+if orjson is not None:
+    # Dates and dataclasses go to the (absent) default hook and so raise,
+    # matching the stdlib path, which cannot serialize them either.
+    _ORJSON_KEY_OPTS = (
+        orjson.OPT_SORT_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+
+
+class LRUCache(Generic[V]):
+    """
+    Thread-safe bounded mapping with least-recently-used eviction.
+
+    Only successful results should be stored; callers treat a miss (None)
+    as "compute it".
+    """
+
+    def __init__(self, max_size: int = 1024) -> None:
+        if max_size < 1:
+            raise ValueError("max_size must be >= 1")
+        self.max_size = max_size
+        self._data: OrderedDict[Hashable, V] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[V]:
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: V) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+def canonical_key(uql: Any) -> Optional[bytes]:
+    """
+    Build an order-independent cache key for a raw UQL dict.
+
+    Returns None when the input is not plain JSON (e.g. it embeds model
+    instances, dates or non-finite floats); such inputs are simply not cached.
+    """
+    if orjson is not None:
+        try:
+            key = orjson.dumps(uql, option=_ORJSON_KEY_OPTS)
+        except TypeError:
+            return None
+        # orjson writes NaN/Infinity as null, so a null in the key may hide
+        # one (orjson rejects float subclasses outright).
+        if b"null" in key and _has_non_finite_float(uql):
+            return None
+        return key
+    return _stdlib_key(uql)
+
+
+def _has_non_finite_float(root: Any) -> bool:
+    # Cheap stand-in for the stdlib's allow_nan=False: no re-serialization.
+    stack: List[Any] = [[root]]
+    while stack:
+        node = stack.pop()
+        for v in node.values() if isinstance(node, dict) else node:
+            t = type(v)
+            if t is str or t is int or v is None:
+                continue
+            if t is float:
+                if not isfinite(v):
+                    return True
+            elif isinstance(v, (dict, list, tuple)):
+                stack.append(v)
+    return False
+
+
+def _stdlib_key(uql: Any) -> Optional[bytes]:
+    try:
+        return json.dumps(
+            uql, sort_keys=True, separators=(",", ":"), allow_nan=False
+        ).encode()
+    except (TypeError, ValueError):
+        return None
@@ -4,12 +4,24 @@ from abc import ABC, abstractmethod
 from collections.abc import Sequence
 from datetime import date, datetime
 from enum import Enum
-from typing import Annotated, Any, Generic, Literal, Optional, TypeVar
+from types import MappingProxyType
+from typing import (
+    Annotated,
+    Any,
+    Callable,
+    Generic,
+    Literal,
+    Mapping,
+    Optional,
+    TypeVar,
+)
 
 from pydantic import BaseModel, ConfigDict, Field, JsonValue, model_validator
 
 from unified_query_maker.utils import validate_qualified_name
 
+_JSON_SCALAR_TYPES = frozenset({str, int, float, bool})
+
 
 def _jsonify_dates(value: object) -> object:
     """
@@ -18,6 +30,9 @@ def _jsonify_dates(value: object) -> object:
     - tuple -> list (common in Python callers)
     - recursively applies to lists/dicts
     """
+    # JSON scalars (the common case) pass through without the chain below.
+    if value is None or type(value) in _JSON_SCALAR_TYPES:
+        return value
     if isinstance(value, datetime):
         return value.isoformat()
     if isinstance(value, date):
@@ -89,10 +104,68 @@ class Operator(str, Enum):
     GEO_INTERSECTS = "geo_intersects"
 
 
+_UNARY_OPERATORS = frozenset({Operator.EXISTS, Operator.NEXISTS})
+_LIST_OPERATORS = frozenset(
+    {Operator.IN, Operator.NIN, Operator.ARRAY_OVERLAP, Operator.ARRAY_CONTAINED}
+)
+_STRING_OPERATORS = frozenset(
+    {
+        Operator.CONTAINS,
+        Operator.NCONTAINS,
+        Operator.ICONTAINS,
+        Operator.STARTS_WITH,
+        Operator.ENDS_WITH,
+        Operator.ILIKE,
+        Operator.REGEX,
+    }
+)
+_GEO_OPERATORS = frozenset({Operator.GEO_WITHIN, Operator.GEO_INTERSECTS})
+
+
+def _require_list(op: Operator, v: object) -> None:
+    if not isinstance(v, list):
+        raise ValueError(f"Operator '{op}' requires a list value")
+
+
+def _require_pair(op: Operator, v: object) -> None:
+    if not isinstance(v, list) or len(v) != 2:
+        raise ValueError("Operator 'between' requires a 2-item list value")
+
+
+def _require_string(op: Operator, v: object) -> None:
+    if not isinstance(v, str):
+        raise ValueError(f"Operator '{op}' requires a string value")
+
+
+def _require_scalar(op: Operator, v: object) -> None:
+    if isinstance(v, list) or isinstance(v, dict):
+        raise ValueError("Operator 'array_contains' requires a scalar JSON value")
+
+
+def _require_object(op: Operator, v: object) -> None:
+    if not isinstance(v, dict):
+        raise ValueError(f"Operator '{op}' requires an object/dict value")
+
+
+# Value-shape rule per operator; operators not listed accept any JSON value.
+_VALUE_RULES: Mapping[Operator, Callable[[Operator, object], None]] = MappingProxyType(
+    {
+        **{op: _require_list for op in _LIST_OPERATORS},
+        Operator.BETWEEN: _require_pair,
+        **{op: _require_string for op in _STRING_OPERATORS},
+        # array_contains: scalar membership (element-in-array)
+        Operator.ARRAY_CONTAINS: _require_scalar,
+        **{op: _require_object for op in _GEO_OPERATORS},
+    }
+)
+
+
 R = TypeVar("R")
 
 
 class FilterVisitor(ABC, Generic[R]):
+    __slots__ = ()
+
     @abstractmethod
     def visit_condition(self, condition: "Condition") -> R: ...
 
@@ -153,60 +226,15 @@ class Condition(FilterExpression):
         validate_qualified_name(self.field, allow_star=False, allow_trailing_star=False)
 
         op = self.operator
-        v = self.value
 
         # Unary ops
-        if op in (Operator.EXISTS, Operator.NEXISTS):
+        if op in _UNARY_OPERATORS:
             self.value = None
             return self
 
-        # IN/NIN: list required
-        if op in (Operator.IN, Operator.NIN):
-            if not isinstance(v, list):
-                raise ValueError(f"Operator '{op}' requires a list value")
-            return self
-
-        # BETWEEN: 2-item list required
-        if op == Operator.BETWEEN:
-            if not isinstance(v, list) or len(v) != 2:
-                raise ValueError("Operator 'between' requires a 2-item list value")
-            return self
-
-        # String ops: string required
-        if op in (
-            Operator.CONTAINS,
-            Operator.NCONTAINS,
-            Operator.ICONTAINS,
-            Operator.STARTS_WITH,
-            Operator.ENDS_WITH,
-            Operator.ILIKE,
-            Operator.REGEX,
-        ):
-            if not isinstance(v, str):
-                raise ValueError(f"Operator '{op}' requires a string value")
-            return self
-
-        # Array ops:
-        # - array_contains: scalar membership (element-in-array)
-        # - array_overlap / array_contained: list required
-        if op == Operator.ARRAY_CONTAINS:
-            if isinstance(v, list) or isinstance(v, dict):
-                raise ValueError(
-                    "Operator 'array_contains' requires a scalar JSON value"
-                )
-            return self
-
-        if op in (Operator.ARRAY_OVERLAP, Operator.ARRAY_CONTAINED):
-            if not isinstance(v, list):
-                raise ValueError(f"Operator '{op}' requires a list value")
-            return self
-
-        # Geo: dict required
-        if op in (Operator.GEO_WITHIN, Operator.GEO_INTERSECTS):
-            if not isinstance(v, dict):
-                raise ValueError(f"Operator '{op}' requires an object/dict value")
-            return self
-
+        rule = _VALUE_RULES.get(op)
+        if rule is not None:
+            rule(op, self.value)
         return self
 
     def accept(self, visitor: FilterVisitor[R]) -> R:
@@ -242,6 +270,18 @@ FilterExpressionModel = Annotated[
     Field(discriminator="type"),
 ]
 
+# Iterative walkers dispatch on `type(node) is ...`; nodes whose type is not
+# one of these exact classes are classified with _node_type() first.
+_FILTER_NODE_TYPES = frozenset({Condition, AndExpression, OrExpression, NotExpression})
+
+
+def _node_type(node: object) -> type:
+    """Built-in filter class that `node` is an instance of (else its own type)."""
+    for base in (Condition, AndExpression, OrExpression, NotExpression):
+        if isinstance(node, base):
+            return base
+    return type(node)
+
 
 class Where:
     """
@@ -1,22 +1,104 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any
-from unified_query_maker.models import QueryOutput
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple, Union
+
+from pydantic import TypeAdapter, ValidationError
+
+from unified_query_maker.cache import LRUCache, canonical_key
+from unified_query_maker.models import QueryOutput, UQLQuery
+
+# Raw UQL dict, or an already-validated model (used as-is).
+UQLInput = Union[Dict[str, Any], UQLQuery]
+
+# Built once so every parse reuses the compiled core schema.
+_UQL_ADAPTER: TypeAdapter[UQLQuery] = TypeAdapter(UQLQuery)
+_UQL_LIST_ADAPTER: TypeAdapter[List[UQLQuery]] = TypeAdapter(List[UQLQuery])
+
+# Translated outputs shared by every translator, keyed by
+# (translator class, output mode, canonical UQL).
+_PLAN_CACHE: LRUCache[Any] = LRUCache(max_size=1024)
+
+
+def clear_plan_cache() -> None:
+    """Drop every memoized translation."""
+    _PLAN_CACHE.clear()
 
 
 class QueryTranslator(ABC):
     """
     Abstract Base Class for all UQL query translators.
+
+    Built-in translators memoize outputs in a process-wide cache keyed by
+    translator class and UQL content. A subclass whose output depends on
+    constructor arguments (schema prefix, quoting mode, ...) must override
+    _cache_token() to return that configuration as a hashable value;
+    otherwise all of its instances share one cached plan per query.
     """
 
+    __slots__ = ()
+
     @abstractmethod
-    def translate(self, query: Dict[str, Any]) -> QueryOutput:
+    def translate(self, query: UQLInput) -> QueryOutput:
         """
         Translates a UQL query dictionary into a database-specific query.
 
         Args:
-            query: The raw UQL query dictionary.
+            query: The raw UQL query dictionary (or a validated UQLQuery).
 
         Returns:
             A database-specific query (e.g., a SQL string or an ES dict).
         """
         pass
+
+    def translate_many(self, uqls: Sequence[UQLInput]) -> List[QueryOutput]:
+        """
+        Translate a batch of queries (same output as translate() per item).
+
+        Translators that implement _translate_parsed() validate the whole
+        batch in a single pass; others fall back to translate() per query.
+        """
+        if type(self)._translate_parsed is QueryTranslator._translate_parsed:
+            return [self.translate(uql) for uql in uqls]
+        return [self._translate_parsed(parsed) for parsed in self._parse_many(uqls)]
+
+    def _translate_parsed(self, parsed: UQLQuery) -> QueryOutput:
+        """
+        Optional hook: translate an already-validated query. Overriding it
+        lets translate_many() validate a batch in one call.
+        """
+        return self.translate(parsed)
+
+    def _parse(self, uql: UQLInput) -> UQLQuery:
+        # Already-validated models are used as-is.
+        if isinstance(uql, UQLQuery):
+            return uql
+        try:
+            return _UQL_ADAPTER.validate_python(uql)
+        except ValidationError as e:
+            raise ValueError(f"Invalid UQL query: {e}") from e
+
+    def _parse_many(self, uqls: Sequence[UQLInput]) -> List[UQLQuery]:
+        # One validation call for the whole batch; models pass through as-is.
+        try:
+            return _UQL_LIST_ADAPTER.validate_python(list(uqls))
+        except ValidationError as e:
+            raise ValueError(f"Invalid UQL query: {e}") from e
+
+    def _plan_cache_key(
+        self, mode: str, uql: UQLInput
+    ) -> Optional[Tuple[Hashable, ...]]:
+        """Key for _PLAN_CACHE, or None when the input cannot be cached."""
+        if isinstance(uql, UQLQuery):
+            return None
+        canon = canonical_key(uql)
+        if canon is None:
+            return None
+        return (type(self), self._cache_token(), mode, canon)
+
+    def _cache_token(self) -> Hashable:
+        """
+        Instance configuration that affects output (part of the cache key).
+
+        Required override for translators with per-instance state; the
+        default (None) means every instance of the class renders alike.
+        """
+        return None
@@ -1,21 +1,24 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Tuple
-
-from pydantic import ValidationError
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Callable, ClassVar, Dict, List, Mapping, Optional, Tuple
 
 from unified_query_maker.models import UQLQuery
 from unified_query_maker.models.where_model import (
     AndExpression,
     Condition,
+    FilterExpression,
     FilterVisitor,
     NotExpression,
     Operator,
     OrExpression,
+    _FILTER_NODE_TYPES,
+    _node_type,
 )
 from unified_query_maker.utils import validate_qualified_name
 
-from .base import QueryTranslator
+from .base import _PLAN_CACHE, QueryTranslator, UQLInput
 
 _LIKE_ESCAPE_CHAR = "\\"
 
@@ -37,9 +40,52 @@ def _escape_like_literal(value: str) -> str:
     )
 
 
+@lru_cache(maxsize=1024)
+def _cached_like_pattern(text: str, prefix: str, suffix: str) -> str:
+    return prefix + _escape_like_literal(text) + suffix
+
+
+def _like_pattern(value: object, prefix: str, suffix: str) -> str:
+    """
+    Escape a literal for LIKE and wrap it in the given wildcards.
+
+    String values (the validated case) are memoized, since the same filter
+    values tend to recur across translated queries.
+    """
+    if isinstance(value, str):
+        return _cached_like_pattern(value, prefix, suffix)
+    return prefix + _escape_like_literal(str(value)) + suffix
+
+
+_SQL_COMPARISON_OPS: Mapping[Operator, str] = MappingProxyType(
+    {
+        Operator.EQ: "=",
+        Operator.NEQ: "<>",
+        Operator.GT: ">",
+        Operator.GTE: ">=",
+        Operator.LT: "<",
+        Operator.LTE: "<=",
+    }
+)
+
+
+# (prefix, suffix, negate, case_insensitive) around an escaped literal.
+_LIKE_LITERAL_SHAPES: Mapping[Operator, Tuple[str, str, bool, bool]] = MappingProxyType(
+    {
+        Operator.CONTAINS: ("%", "%", False, False),
+        Operator.NCONTAINS: ("%", "%", True, False),
+        Operator.ICONTAINS: ("%", "%", False, True),
+        Operator.STARTS_WITH: ("", "%", False, False),
+        Operator.ENDS_WITH: ("%", "", False, False),
+    }
+)
+
+
 class SQLConditionTranslator(FilterVisitor[str]):
     """Visitor that translates Where-model expressions to SQL condition strings."""
 
+    __slots__ = ("parent",)
+
     def __init__(self, parent_translator: "SQLTranslator"):
         self.parent = parent_translator
 
@@ -49,110 +95,160 @@ class SQLConditionTranslator(FilterVisitor[str]):
         value = condition.value
 
         # NULL semantics
-        if op == Operator.EQ and value is None:
-            return f"{field_sql} IS NULL"
-        if op == Operator.NEQ and value is None:
-            return f"{field_sql} IS NOT NULL"
-
-        # Existence (unary)
-        if op == Operator.EXISTS:
-            return f"{field_sql} IS NOT NULL"
-        if op == Operator.NEXISTS:
-            return f"{field_sql} IS NULL"
-
-        # Basic comparisons
-        if op == Operator.EQ:
-            return f"{field_sql} = {self.parent._value(value)}"
-        if op == Operator.NEQ:
-            return f"{field_sql} <> {self.parent._value(value)}"
-        if op == Operator.GT:
-            return f"{field_sql} > {self.parent._value(value)}"
-        if op == Operator.GTE:
-            return f"{field_sql} >= {self.parent._value(value)}"
-        if op == Operator.LT:
-            return f"{field_sql} < {self.parent._value(value)}"
-        if op == Operator.LTE:
-            return f"{field_sql} <= {self.parent._value(value)}"
-
-        # BETWEEN
-        if op == Operator.BETWEEN:
-            if not isinstance(value, list) or len(value) != 2:
-                raise ValueError("BETWEEN expects a 2-item list value")
-            lo, hi = value
-            return f"{field_sql} BETWEEN {self.parent._value(lo)} AND {self.parent._value(hi)}"
-
-        # IN / NIN
-        if op in (Operator.IN, Operator.NIN):
-            if not isinstance(value, list) or len(value) == 0:
-                raise ValueError("IN/NIN expects a non-empty list value")
-            in_list = self.parent._values_list(value)
-            if op == Operator.IN:
-                return f"{field_sql} IN {in_list}"
-            return f"{field_sql} NOT IN {in_list}"
-
-        # Strings (built on LIKE/ILIKE)
-        if op == Operator.CONTAINS:
-            pat = f"%{_escape_like_literal(str(value))}%"
-            return self.parent._render_like(
-                field_sql=field_sql, pattern=pat, negate=False, case_insensitive=False
-            )
-        if op == Operator.NCONTAINS:
-            pat = f"%{_escape_like_literal(str(value))}%"
-            return self.parent._render_like(
-                field_sql=field_sql, pattern=pat, negate=True, case_insensitive=False
-            )
-        if op == Operator.ICONTAINS:
-            pat = f"%{_escape_like_literal(str(value))}%"
-            return self.parent._render_like(
-                field_sql=field_sql, pattern=pat, negate=False, case_insensitive=True
-            )
-        if op == Operator.STARTS_WITH:
-            pat = f"{_escape_like_literal(str(value))}%"
-            return self.parent._render_like(
-                field_sql=field_sql, pattern=pat, negate=False, case_insensitive=False
-            )
-        if op == Operator.ENDS_WITH:
-            pat = f"%{_escape_like_literal(str(value))}"
-            return self.parent._render_like(
-                field_sql=field_sql, pattern=pat, negate=False, case_insensitive=False
-            )
-        if op == Operator.ILIKE:
-            # Treat as raw pattern (caller supplies %, _ as desired)
-            return self.parent._render_like(
-                field_sql=field_sql,
-                pattern=str(value),
-                negate=False,
-                case_insensitive=True,
-            )
-        if op == Operator.REGEX:
-            return self.parent._render_regex(field_sql, value)
+        if value is None:
+            if op is Operator.EQ:
+                return f"{field_sql} IS NULL"
+            if op is Operator.NEQ:
+                return f"{field_sql} IS NOT NULL"
 
-        # Arrays (dialect-specific)
-        if op == Operator.ARRAY_CONTAINS:
-            return self.parent._render_array_contains(field_sql, value)
-        if op == Operator.ARRAY_OVERLAP:
-            return self.parent._render_array_overlap(field_sql, value)
-        if op == Operator.ARRAY_CONTAINED:
-            return self.parent._render_array_contained(field_sql, value)
+        handler = self._DISPATCH.get(op)
+        if handler is None:
+            raise ValueError(f"Unsupported operator for SQL: {op}")
+        return handler(self, op, field_sql, value)
 
-        # Geo not supported in SQL translators by default
-        if op in (Operator.GEO_WITHIN, Operator.GEO_INTERSECTS):
-            raise ValueError("GEO operators are not supported for SQL translators")
+    # ---------- Operator handlers ----------
 
-        raise ValueError(f"Unsupported operator for SQL: {op}")
+    def _render_comparison(self, op: Operator, field_sql: str, value: Any) -> str:
+        return f"{field_sql} {_SQL_COMPARISON_OPS[op]} {self.parent._value(value)}"
 
-    def visit_and(self, and_expr: AndExpression) -> str:
+    def _render_exists(self, op: Operator, field_sql: str, value: Any) -> str:
+        return f"{field_sql} IS NOT NULL"
+
+    def _render_nexists(self, op: Operator, field_sql: str, value: Any) -> str:
+        return f"{field_sql} IS NULL"
+
+    def _render_between(self, op: Operator, field_sql: str, value: Any) -> str:
+        lo, hi = value
         return (
-            "(" + " AND ".join(expr.accept(self) for expr in and_expr.expressions) + ")"
+            f"{field_sql} BETWEEN {self.parent._value(lo)} AND {self.parent._value(hi)}"
         )
 
-    def visit_or(self, or_expr: OrExpression) -> str:
-        return (
-            "(" + " OR ".join(expr.accept(self) for expr in or_expr.expressions) + ")"
+    def _render_membership(self, op: Operator, field_sql: str, value: Any) -> str:
+        # The model guarantees a list; only emptiness is left to check.
+        if not value:
+            raise ValueError("IN/NIN expects a non-empty list value")
+        in_list = self.parent._values_list(value)
+        if op is Operator.IN:
+            return f"{field_sql} IN {in_list}"
+        return f"{field_sql} NOT IN {in_list}"
+
+    # Strings (built on LIKE/ILIKE)
+
+    def _render_like_literal(self, op: Operator, field_sql: str, value: Any) -> str:
+        prefix, suffix, negate, case_insensitive = _LIKE_LITERAL_SHAPES[op]
+        return self.parent._render_like(
+            field_sql=field_sql,
+            pattern=_like_pattern(value, prefix, suffix),
+            negate=negate,
+            case_insensitive=case_insensitive,
+        )
+
+    def _render_ilike(self, op: Operator, field_sql: str, value: Any) -> str:
+        # Treat as raw pattern (caller supplies %, _ as desired)
+        return self.parent._render_like(
+            field_sql=field_sql,
+            pattern=str(value),
+            negate=False,
+            case_insensitive=True,
         )
 
+    def _render_regex(self, op: Operator, field_sql: str, value: Any) -> str:
+        return self.parent._render_regex(field_sql, value)
+
+    # Arrays (dialect-specific)
+
+    def _render_array_contains(self, op: Operator, field_sql: str, value: Any) -> str:
+        return self.parent._render_array_contains(field_sql, value)
+
+    def _render_array_overlap(self, op: Operator, field_sql: str, value: Any) -> str:
+        return self.parent._render_array_overlap(field_sql, value)
+
+    def _render_array_contained(self, op: Operator, field_sql: str, value: Any) -> str:
+        return self.parent._render_array_contained(field_sql, value)
+
+    def _render_geo(self, op: Operator, field_sql: str, value: Any) -> str:
+        # Geo not supported in SQL translators by default
+        raise ValueError("GEO operators are not supported for SQL translators")
+
+    # Operator is a str-backed enum, so lookups hash like plain strings.
+    _DISPATCH: ClassVar[
+        Dict[Operator, Callable[["SQLConditionTranslator", Operator, str, Any], str]]
+    ] = {
+        Operator.EQ: _render_comparison,
+        Operator.NEQ: _render_comparison,
+        Operator.GT: _render_comparison,
+        Operator.GTE: _render_comparison,
+        Operator.LT: _render_comparison,
+        Operator.LTE: _render_comparison,
+        Operator.EXISTS: _render_exists,
+        Operator.NEXISTS: _render_nexists,
+        Operator.BETWEEN: _render_between,
+        Operator.IN: _render_membership,
+        Operator.NIN: _render_membership,
+        Operator.CONTAINS: _render_like_literal,
+        Operator.NCONTAINS: _render_like_literal,
+        Operator.ICONTAINS: _render_like_literal,
+        Operator.STARTS_WITH: _render_like_literal,
+        Operator.ENDS_WITH: _render_like_literal,
+        Operator.ILIKE: _render_ilike,
+        Operator.REGEX: _render_regex,
+        Operator.ARRAY_CONTAINS: _render_array_contains,
+        Operator.ARRAY_OVERLAP: _render_array_overlap,
+        Operator.ARRAY_CONTAINED: _render_array_contained,
+        Operator.GEO_WITHIN: _render_geo,
+        Operator.GEO_INTERSECTS: _render_geo,
+    }
+
+    def visit_and(self, and_expr: AndExpression) -> str:
+        return self.walk(and_expr)
+
+    def visit_or(self, or_expr: OrExpression) -> str:
+        return self.walk(or_expr)
+
     def visit_not(self, not_expr: NotExpression) -> str:
-        return f"(NOT {not_expr.expression.accept(self)})"
+        return self.walk(not_expr)
+
+    def walk(self, root: FilterExpression) -> str:
+        out: List[str] = []
+        self.emit(root, out)
+        return "".join(out)
+
+    def emit(self, root: FilterExpression, out: List[str]) -> None:
+        """
+        Append the SQL for `root` to `out` without recursing.
+
+        The stack holds pending nodes and literal fragments in reverse output
+        order, so arbitrarily deep And/Or/Not trees never hit the recursion
+        limit and compound nodes cost no method calls.
+        """
+        stack: List[Any] = [root]
+        pop = stack.pop
+        push = stack.append
+        while stack:
+            node = pop()
+            t = type(node)
+            if t is str:
+                out.append(node)
+                continue
+            if t not in _FILTER_NODE_TYPES:
+                t = _node_type(node)
+            if t is Condition:
+                out.append(self.visit_condition(node))
+            elif t is AndExpression or t is OrExpression:
+                sep = " AND " if t is AndExpression else " OR "
+                push(")")
+                children = node.expressions
+                for i in range(len(children) - 1, 0, -1):
+                    push(children[i])
+                    push(sep)
+                push(children[0])
+                push("(")
+            elif t is NotExpression:
+                push(")")
+                push(node.expression)
+                push("(NOT ")
+            else:
+                out.append(node.accept(self))
 
 
 class SQLTranslator(QueryTranslator):
@@ -161,101 +257,153 @@ class SQLTranslator(QueryTranslator):
 
     - translate(uql) -> SQL string with literals (backwards compatible)
     - translate_with_params(uql) -> (sql, params) for safe execution
+
+    Instances use __slots__; dialect subclasses declare their own (usually
+    empty) __slots__ and keep configuration in ClassVars.
     """
 
+    __slots__ = ("_params", "_where_visitor", "_col_cache", "_tbl_cache", "_str_cache")
+
+    # Whether _escape_identifier() is overridden (set per class in
+    # __init_subclass__); otherwise identifiers are emitted as validated.
+    _identifier_needs_quoting: ClassVar[bool] = False
+
+    # True when _param_placeholder() may depend on the bind position (e.g.
+    # :1, :2). Assumed for any class that overrides _param_placeholder()
+    # without declaring this flag itself.
+    _indexed_placeholders: ClassVar[bool] = False
+
+    # Upper bound on memoized escaped names and string literals per instance
+    # (each cache separately); a full cache is simply reset.
+    _escape_cache_size: ClassVar[int] = 512
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._identifier_needs_quoting = (
+            cls._escape_identifier is not SQLTranslator._escape_identifier
+        )
+        if (
+            "_param_placeholder" in cls.__dict__
+            and "_indexed_placeholders" not in cls.__dict__
+        ):
+            cls._indexed_placeholders = True
+
     def __init__(self) -> None:
         self._params: Optional[List[Any]] = None
+        self._where_visitor = SQLConditionTranslator(self)
+        self._col_cache: Dict[str, str] = {}
+        self._tbl_cache: Dict[str, str] = {}
+        self._str_cache: Dict[str, str] = {}
 
     # ---------- Public API ----------
 
-    def translate(self, uql: Dict[str, Any]) -> str:
-        parsed = self._parse(uql)
-        self._params = None
-        sql = self._build_sql(parsed)
+    def translate(self, uql: UQLInput) -> str:
+        key = self._plan_cache_key("sql", uql)
+        if key is not None:
+            cached = _PLAN_CACHE.get(key)
+            if cached is not None:
+                return cached
+
+        sql = self._translate_parsed(self._parse(uql))
+
+        if key is not None:
+            _PLAN_CACHE.put(key, sql)
         return sql
 
-    def translate_with_params(self, uql: Dict[str, Any]) -> Tuple[str, List[Any]]:
+    def translate_with_params(self, uql: UQLInput) -> Tuple[str, List[Any]]:
+        key = self._plan_cache_key("params", uql)
+        if key is not None:
+            cached = _PLAN_CACHE.get(key)
+            if cached is not None:
+                sql, bound = cached
+                return sql, list(bound)
+
         parsed = self._parse(uql)
         self._params = []
         try:
             sql = self._build_sql(parsed)
-            return sql, list(self._params)
+            params = list(self._params)
         finally:
             # make mode explicit + avoid accidental reuse
             self._params = None
 
+        if key is not None:
+            _PLAN_CACHE.put(key, (sql, tuple(params)))
+        return sql, params
+
     # ---------- Parsing / orchestration ----------
 
-    def _parse(self, uql: Dict[str, Any]) -> UQLQuery:
-        try:
-            return UQLQuery.model_validate(uql)
-        except ValidationError as e:
-            raise ValueError(f"Invalid UQL query: {e}") from e
+    def _translate_parsed(self, parsed: UQLQuery) -> str:
+        self._params = None
+        return self._build_sql(parsed)
 
     def _build_sql(self, query: UQLQuery) -> str:
-        parts = [
-            self._build_select_clause(query),
-            self._build_from_clause(query),
-        ]
+        buf = [self._build_select_clause(query), self._build_from_clause(query)]
 
         where_clause = self._build_where_clause(query)
         if where_clause:
-            parts.append(where_clause)
+            buf.append(where_clause)
 
         order_by = self._build_order_by_clause(query)
         if order_by:
-            parts.append(order_by)
+            buf.append(order_by)
 
         limit_clause = self._build_limit_clause(query)
         if limit_clause:
-            parts.append(limit_clause)
+            buf.append(limit_clause)
 
-        return " ".join(p for p in parts if p).strip() + ";"
+        return " ".join(buf) + ";"
 
     # ---------- Clause builders ----------
 
     def _build_select_clause(self, query: UQLQuery) -> str:
-        if not query.select or query.select == ["*"]:
+        select = query.select
+        if not select or select == ["*"]:
             return "SELECT *"
-        cols = ", ".join(self._escape_column_name(c) for c in query.select)
-        return f"SELECT {cols}"
+        escape = self._escape_column_name
+        return "SELECT " + ", ".join([escape(c) for c in select])
 
     def _build_from_clause(self, query: UQLQuery) -> str:
         return f"FROM {self._escape_table_name(query.from_table)}"
 
     def _build_where_clause(self, query: UQLQuery) -> str:
-        if not query.where:
-            return ""
-
-        visitor = SQLConditionTranslator(self)
-        parts: List[str] = []
-
-        if query.where.must:
-            parts.append(
-                " AND ".join(expr.accept(visitor) for expr in query.where.must)
-            )
-            parts[-1] = f"({parts[-1]})"
-
-        if query.where.must_not:
-            not_parts = [
-                f"(NOT ({expr.accept(visitor)}))" for expr in query.where.must_not
-            ]
-            parts.append(" AND ".join(not_parts))
-            parts[-1] = f"({parts[-1]})"
-
-        if not parts:
+        where = query.where
+        # {"must": [], "must_not": []} filters nothing; skip the assembly.
+        if not where or not (where.must or where.must_not):
             return ""
 
-        return "WHERE " + " AND ".join(parts)
+        visitor = self._where_visitor
+        frags: List[str] = ["WHERE "]
+
+        if where.must:
+            frags.append("(")
+            for i, expr in enumerate(where.must):
+                if i:
+                    frags.append(" AND ")
+                visitor.emit(expr, frags)
+            frags.append(")")
+
+        if where.must_not:
+            if where.must:
+                frags.append(" AND ")
+            frags.append("(")
+            for i, expr in enumerate(where.must_not):
+                if i:
+                    frags.append(" AND ")
+                frags.append("NOT (")
+                visitor.emit(expr, frags)
+                frags.append(")")
+            frags.append(")")
+
+        return "".join(frags)
 
     def _build_order_by_clause(self, query: UQLQuery) -> str:
         if not query.orderBy:
             return ""
-        items = []
-        for item in query.orderBy:
-            col = self._escape_column_name(item.field)
-            items.append(f"{col} {item.order}")
-        return "ORDER BY " + ", ".join(items)
+        escape = self._escape_column_name
+        return "ORDER BY " + ", ".join(
+            [f"{escape(item.field)} {item.order}" for item in query.orderBy]
+        )
 
     def _build_limit_clause(self, query: UQLQuery) -> str:
         limit = query.limit
@@ -276,22 +424,46 @@ class SQLTranslator(QueryTranslator):
         return identifier
 
     def _escape_column_name(self, name: str) -> str:
+        cached = self._col_cache.get(name)
+        if cached is not None:
+            return cached
+
         raw = str(name).strip()
         validate_qualified_name(raw, allow_star=False, allow_trailing_star=True)
+        if not self._identifier_needs_quoting:
+            escaped = raw
+        else:
+            # Segments are non-empty and whitespace-free once validated.
+            base, _, tail = raw.rpartition(".")
+            if tail == "*":
+                escaped = (
+                    ".".join(self._escape_identifier(p) for p in base.split(".")) + ".*"
+                )
+            else:
+                escaped = ".".join(self._escape_identifier(p) for p in raw.split("."))
 
-        if raw.endswith(".*"):
-            base = raw[:-2]
-            parts = [p.strip() for p in base.split(".") if p.strip()]
-            return ".".join(self._escape_identifier(p) for p in parts) + ".*"
-
-        parts = [p.strip() for p in raw.split(".") if p.strip()]
-        return ".".join(self._escape_identifier(p) for p in parts)
+        return self._remember(self._col_cache, name, escaped)
 
     def _escape_table_name(self, name: str) -> str:
+        cached = self._tbl_cache.get(name)
+        if cached is not None:
+            return cached
+
         raw = str(name).strip()
         validate_qualified_name(raw, allow_star=False, allow_trailing_star=False)
-        parts = [p.strip() for p in raw.split(".") if p.strip()]
-        return ".".join(self._escape_identifier(p) for p in parts)
+        if not self._identifier_needs_quoting:
+            escaped = raw
+        else:
+            escaped = ".".join(self._escape_identifier(p) for p in raw.split("."))
+
+        return self._remember(self._tbl_cache, name, escaped)
+
+    def _remember(self, cache: Dict[str, str], name: str, escaped: str) -> str:
+        # Only validated names reach here, so failures are never memoized.
+        if len(cache) >= self._escape_cache_size:
+            cache.clear()
+        cache[name] = escaped
+        return escaped
 
     # ---------- Values / parameterization ----------
 
@@ -332,25 +504,53 @@ class SQLTranslator(QueryTranslator):
             # literal mode keeps existing behavior
             return self._format_value(values)
 
-        placeholders: List[str] = []
-        for v in values:
-            if isinstance(v, (list, tuple)):
-                raise ValueError("Nested lists are not supported in IN/NIN")
-            self._params.append(v)
-            placeholders.append(self._param_placeholder(len(self._params)))
-        return "(" + ", ".join(placeholders) + ")"
+        if any(isinstance(v, (list, tuple)) for v in values):
+            raise ValueError("Nested lists are not supported in IN/NIN")
+
+        start = len(self._params)
+        self._params.extend(values)
+
+        if not self._indexed_placeholders:
+            # Same marker for every bind: repeat it instead of building a list.
+            ph = self._param_placeholder(start + 1)
+            return "(" + ph + (", " + ph) * (len(values) - 1) + ")"
+
+        return (
+            "("
+            + ", ".join(
+                self._param_placeholder(i)
+                for i in range(start + 1, start + len(values) + 1)
+            )
+            + ")"
+        )
 
     def _escape_string(self, value: str) -> str:
         """Dialect hook: escape a Python string for SQL string literals."""
+        if "'" not in value:
+            return value
         return value.replace("'", "''")
 
     def _format_bool(self, value: bool) -> str:
         return "TRUE" if value else "FALSE"
 
     def _format_value(self, value: Any) -> str:
+        t = type(value)
+        if t is str:
+            # Filter values recur across queries; quote/escape each only once.
+            literal = self._str_cache.get(value)
+            if literal is None:
+                literal = self._remember(
+                    self._str_cache, value, f"'{self._escape_string(value)}'"
+                )
+            return literal
         if value is None:
             return "NULL"
-        if isinstance(value, bool):
+        # Exact-type checks skip the MRO walk and cannot mistake a bool for an
+        # int (bool cannot be subclassed); the isinstance chain below only
+        # sees int/float/str subclasses.
+        if t is int or t is float:
+            return str(value)
+        if t is bool:
             return self._format_bool(value)
         if isinstance(value, (int, float)):
             return str(value)
@@ -358,6 +558,9 @@ class SQLTranslator(QueryTranslator):
             items = list(value)
             if len(items) == 0:
                 raise ValueError("Empty lists cannot be rendered as SQL literals")
+            # Large IN lists are usually plain ints: let str() run in C.
+            if all(type(v) is int for v in items):
+                return "(" + ", ".join(map(str, items)) + ")"
             return "(" + ", ".join(self._format_value(v) for v in items) + ")"
         if isinstance(value, str):
             return f"'{self._escape_string(value)}'"
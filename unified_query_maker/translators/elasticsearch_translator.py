@@ -1,22 +1,59 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
-
-from pydantic import ValidationError
+import re
+from functools import lru_cache
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    Hashable,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+)
 
 from unified_query_maker.models import UQLQuery
+from unified_query_maker.models.uql import WhereClause
 from unified_query_maker.models.where_model import (
     AndExpression,
     Condition,
     FilterExpression,
+    FilterExpressionModel,
     FilterVisitor,
     NotExpression,
     Operator,
     OrExpression,
+    _FILTER_NODE_TYPES,
+    _node_type,
+)
+from unified_query_maker.translators.base import _PLAN_CACHE, QueryTranslator, UQLInput
+from unified_query_maker.utils import copy_json, dumps_json, loads_json
+
+# ES wildcard meta characters ('*', '?', '\\') escaped for literal matching.
+_WILDCARD_LITERAL_TABLE = str.maketrans({"*": "\\*", "?": "\\?", "\\": "\\\\"})
+
+# One token per match: a backslash escape (or a dangling trailing backslash),
+# a LIKE wildcard, or a bare ES wildcard meta character.
+_LIKE_TOKEN_RE = re.compile(r"\\.?|[%_*?]", re.DOTALL)
+
+_LIKE_WILDCARDS: Mapping[str, str] = MappingProxyType(
+    {"%": "*", "_": "?", "*": "\\*", "?": "\\?"}
 )
-from unified_query_maker.translators.base import QueryTranslator
 
 
+def _like_token_to_wildcard(m: re.Match[str]) -> str:
+    tok = m.group(0)
+    if tok[0] == "\\":
+        return _escape_wildcard_literal(tok[1:] or "\\")
+    return _LIKE_WILDCARDS[tok]
+
+
+@lru_cache(maxsize=4096)
 def _like_to_wildcard_pattern(pattern: str) -> str:
     """
     Convert SQL LIKE pattern (%, _) into ES wildcard (*, ?).
@@ -24,31 +61,7 @@ def _like_to_wildcard_pattern(pattern: str) -> str:
     - Treat backslash (\\) as escaping the next char (matching SQL ESCAPE '\\').
     - Escape ES wildcard meta characters in literal output.
     """
-    out: list[str] = []
-    s = str(pattern)
-    i = 0
-
-    while i < len(s):
-        ch = s[i]
-
-        if ch == "\\":
-            i += 1
-            if i >= len(s):
-                out.append(_escape_wildcard_literal("\\"))
-                break
-            out.append(_escape_wildcard_literal(s[i]))
-            i += 1
-            continue
-
-        if ch == "%":
-            out.append("*")
-        elif ch == "_":
-            out.append("?")
-        else:
-            out.append(_escape_wildcard_literal(ch))
-        i += 1
-
-    return "".join(out)
+    return _LIKE_TOKEN_RE.sub(_like_token_to_wildcard, str(pattern))
 
 
 def _escape_wildcard_literal(value: str) -> str:
@@ -57,153 +70,482 @@ def _escape_wildcard_literal(value: str) -> str:
 
     In ES wildcard syntax, '*', '?', and '\\' are special.
     """
-    out: list[str] = []
-    for ch in str(value):
-        if ch in ("*", "?", "\\"):
-            out.append("\\" + ch)
+    return str(value).translate(_WILDCARD_LITERAL_TABLE)
+
+
+# Negated operators are rendered as bool.must_not around their positive form.
+_NEGATED_OPERATORS: Mapping[Operator, Operator] = MappingProxyType(
+    {
+        Operator.NEQ: Operator.EQ,
+        Operator.NIN: Operator.IN,
+        Operator.NEXISTS: Operator.EXISTS,
+        Operator.NCONTAINS: Operator.CONTAINS,
+    }
+)
+
+_RANGE_BOUNDS: Mapping[Operator, str] = MappingProxyType(
+    {
+        Operator.GT: "gt",
+        Operator.GTE: "gte",
+        Operator.LT: "lt",
+        Operator.LTE: "lte",
+    }
+)
+
+_GEO_RELATIONS: Mapping[Operator, str] = MappingProxyType(
+    {Operator.GEO_WITHIN: "within", Operator.GEO_INTERSECTS: "intersects"}
+)
+
+# Top-level conditions that only narrow the result set; they go to the bool
+# "filter" context (no scoring, cacheable by ES). Negated operators are not
+# listed because they already end up in must_not, which is non-scoring too.
+_FILTER_CONTEXT_OPERATORS = frozenset(
+    {
+        Operator.CONTAINS,
+        Operator.ICONTAINS,
+        Operator.ENDS_WITH,
+        Operator.STARTS_WITH,
+        Operator.ILIKE,
+        Operator.REGEX,
+        Operator.EXISTS,
+        Operator.IN,
+        Operator.BETWEEN,
+        Operator.GT,
+        Operator.GTE,
+        Operator.LT,
+        Operator.LTE,
+    }
+)
+
+# Operators routed to the "<field>.wildcard" subfield for configured fields.
+_WILDCARD_FIELD_OPERATORS = frozenset(
+    {
+        Operator.CONTAINS,
+        Operator.ICONTAINS,
+        Operator.ENDS_WITH,
+        Operator.ILIKE,
+        Operator.REGEX,
+    }
+)
+
+# UQL sort direction -> ES "order" value (OrderByItem only admits ASC/DESC).
+_SORT_ORDER: Mapping[str, str] = MappingProxyType({"ASC": "asc", "DESC": "desc"})
+
+
+# array_contained check: every value of doc[f] must be in params.allowed.
+# Painless script is portable across common ES versions.
+_ARRAY_CONTAINED_SOURCE = (
+    "def vals = doc.containsKey(params.f) ? doc[params.f] : null; "
+    "if (vals == null) return true; "
+    "for (def v : vals) { if (!params.allowed.contains(v)) return false; } "
+    "return true;"
+)
+
+
+def _match_all() -> Dict[str, Any]:
+    return {"match_all": {}}
+
+
+def _match_none() -> Dict[str, Any]:
+    return {"match_none": {}}
+
+
+# Constant clauses are built fresh per use (callers may mutate the output) and
+# recognised by shape, so they can be folded away by the combiners below.
+def _is_match_all(clause: Dict[str, Any]) -> bool:
+    return len(clause) == 1 and "match_all" in clause
+
+
+def _is_match_none(clause: Dict[str, Any]) -> bool:
+    return len(clause) == 1 and "match_none" in clause
+
+
+def _flatten(
+    node_type: type, expressions: List[FilterExpressionModel]
+) -> List[FilterExpressionModel]:
+    """Inline children of the same And/Or type (associativity), in order."""
+    if not any(type(e) is node_type for e in expressions):
+        return expressions
+
+    out: List[FilterExpressionModel] = []
+    stack = expressions[::-1]
+    while stack:
+        expr = stack.pop()
+        if type(expr) is node_type:
+            stack.extend(expr.expressions[::-1])  # type: ignore[attr-defined]
+        else:
+            out.append(expr)
+    return out
+
+
+def _split_negations(
+    clauses: List[Dict[str, Any]],
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Partition clauses into (positive, negated) for a conjunction.
+
+    A clause that is exactly {"bool": {"must_not": [...]}} contributes its
+    must_not items to the enclosing bool instead of adding a wrapper level.
+    """
+    positive: List[Dict[str, Any]] = []
+    negated: List[Dict[str, Any]] = []
+    for clause in clauses:
+        inner = clause.get("bool") if len(clause) == 1 else None
+        if inner is not None and len(inner) == 1 and "must_not" in inner:
+            negated.extend(inner["must_not"])
         else:
-            out.append(ch)
-    return "".join(out)
+            positive.append(clause)
+    return positive, negated
+
+
+_LOWER_BOUNDS = frozenset({"gt", "gte"})
+_UPPER_BOUNDS = frozenset({"lt", "lte"})
+
+
+def _merge_ranges(clauses: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Merge conjunctive {"range": {field: bounds}} clauses on the same field.
+
+    Bounds are only combined when the result still has at most one lower
+    (gt/gte) and one upper (lt/lte) bound; anything else is kept as-is.
+    """
+    merged: List[Dict[str, Any]] = []
+    bounds_by_field: Dict[str, Dict[str, Any]] = {}
+    for clause in clauses:
+        rng = clause.get("range") if len(clause) == 1 else None
+        if rng is None or len(rng) != 1:
+            merged.append(clause)
+            continue
+
+        field = next(iter(rng))
+        bounds = rng[field]
+        prev = bounds_by_field.get(field)
+        if prev is not None:
+            keys = prev.keys() | bounds.keys()
+            if (
+                len(keys) == len(prev) + len(bounds)
+                and len(keys & _LOWER_BOUNDS) <= 1
+                and len(keys & _UPPER_BOUNDS) <= 1
+            ):
+                prev.update(bounds)
+                continue
+
+        own = dict(bounds)
+        bounds_by_field[field] = own
+        merged.append({"range": {field: own}})
+    return merged
 
 
 class ElasticsearchConditionTranslator(FilterVisitor[Dict[str, Any]]):
     """Visitor that translates Where-model expressions to Elasticsearch Query DSL."""
 
+    __slots__ = ("_wildcard_fields", "_array_contained_script_id")
+
+    def __init__(
+        self,
+        wildcard_fields: Iterable[str] = (),
+        array_contained_script_id: Optional[str] = None,
+    ) -> None:
+        # Fields whose wildcard-style operators target the "<field>.wildcard"
+        # subfield (ES `wildcard` field type) instead of the field itself.
+        self._wildcard_fields: FrozenSet[str] = frozenset(wildcard_fields)
+        # Stored-script id for array_contained; None inlines the source.
+        self._array_contained_script_id = array_contained_script_id
+
     def visit_condition(self, condition: Condition) -> Dict[str, Any]:
         field = condition.field
         op = condition.operator
-        value = condition.value
-
-        # Existence
-        if op == Operator.EXISTS:
-            return {"exists": {"field": field}}
-        if op == Operator.NEXISTS:
-            return {"bool": {"must_not": [{"exists": {"field": field}}]}}
-
-        # Equality
-        if op == Operator.EQ:
-            return {"term": {field: value}}
-        if op == Operator.NEQ:
-            return {"bool": {"must_not": [{"term": {field: value}}]}}
-
-        # Comparison / ranges
-        if op == Operator.GT:
-            return {"range": {field: {"gt": value}}}
-        if op == Operator.GTE:
-            return {"range": {field: {"gte": value}}}
-        if op == Operator.LT:
-            return {"range": {field: {"lt": value}}}
-        if op == Operator.LTE:
-            return {"range": {field: {"lte": value}}}
-        if op == Operator.BETWEEN:
-            if not isinstance(value, list) or len(value) != 2:
-                raise ValueError("BETWEEN expects a 2-item list value")
-            lo, hi = value
-            return {"range": {field: {"gte": lo, "lte": hi}}}
-
-        # Membership
-        if op == Operator.IN:
-            return {"terms": {field: value}}
-        if op == Operator.NIN:
-            return {"bool": {"must_not": [{"terms": {field: value}}]}}
-
-        # String ops (wildcard/prefix/regexp)
-        if op == Operator.CONTAINS:
-            lit = _escape_wildcard_literal(str(value))
-            return {"wildcard": {field: f"*{lit}*"}}
-
-        if op == Operator.NCONTAINS:
-            lit = _escape_wildcard_literal(str(value))
-            return {"bool": {"must_not": [{"wildcard": {field: f"*{lit}*"}}]}}
-
-        if op == Operator.ICONTAINS:
-            lit = _escape_wildcard_literal(str(value))
-            return {
-                "wildcard": {field: {"value": f"*{lit}*", "case_insensitive": True}}
-            }
-
-        if op == Operator.ENDS_WITH:
-            lit = _escape_wildcard_literal(str(value))
-            return {"wildcard": {field: f"*{lit}"}}
-        if op == Operator.STARTS_WITH:
-            return {"prefix": {field: value}}
-
-        if op == Operator.ILIKE:
-            if not isinstance(value, str):
-                raise ValueError("ILIKE expects a string pattern")
-            wildcard = _like_to_wildcard_pattern(value)
-            return {"wildcard": {field: {"value": wildcard, "case_insensitive": True}}}
-        if op == Operator.REGEX:
-            return {"regexp": {field: value}}
-
-        # Arrays
-        if op == Operator.ARRAY_CONTAINS:
-            # For arrays of primitives, term matches any element; list semantics are backend-specific.
-            if isinstance(value, list):
-                # Best-effort: require all provided values to be present (bool must of terms).
-                return {"bool": {"must": [{"term": {field: v}} for v in value]}}
-            return {"term": {field: value}}
-
-        if op == Operator.ARRAY_OVERLAP:
-            return {"terms": {field: value}}
-
-        if op == Operator.ARRAY_CONTAINED:
-            # Ensure all elements of doc[field] are within the allowed list.
-            # Painless script is portable across common ES versions.
-            if not isinstance(value, list):
-                raise ValueError("ARRAY_CONTAINED expects a list value")
-            return {
+        # Copied so callers can mutate the output without touching the model.
+        value = copy_json(condition.value)
+
+        positive = _NEGATED_OPERATORS.get(op)
+        if positive is not None:
+            return _combine_not([self._render(positive, field, value)])
+        return self._render(op, field, value)
+
+    def _render(self, op: Operator, field: str, value: Any) -> Dict[str, Any]:
+        if field in self._wildcard_fields and op in _WILDCARD_FIELD_OPERATORS:
+            field = f"{field}.wildcard"
+        handler = self._DISPATCH.get(op)
+        if handler is None:
+            raise ValueError(f"Unsupported operator for Elasticsearch: {op}")
+        return handler(self, op, field, value)
+
+    # ---------- Operator handlers ----------
+    # Value shapes (BETWEEN pairs, list and string operands, scalar-only
+    # ARRAY_CONTAINS) are enforced when the Condition is validated.
+
+    def _render_exists(self, op: Operator, field: str, value: Any) -> Dict[str, Any]:
+        return {"exists": {"field": field}}
+
+    def _render_term(self, op: Operator, field: str, value: Any) -> Dict[str, Any]:
+        return {"term": {field: value}}
+
+    def _render_range(self, op: Operator, field: str, value: Any) -> Dict[str, Any]:
+        return {"range": {field: {_RANGE_BOUNDS[op]: value}}}
+
+    def _render_between(self, op: Operator, field: str, value: Any) -> Dict[str, Any]:
+        lo, hi = value
+        return {"range": {field: {"gte": lo, "lte": hi}}}
+
+    def _render_terms(self, op: Operator, field: str, value: Any) -> Dict[str, Any]:
+        if not value:
+            # Nothing can be a member of an empty list.
+            return _match_none()
+        return {"terms": {field: value}}
+
+    # String ops (wildcard/prefix/regexp)
+
+    def _render_contains(self, op: Operator, field: str, value: Any) -> Dict[str, Any]:
+        lit = _escape_wildcard_literal(str(value))
+        return {"wildcard": {field: f"*{lit}*"}}
+
+    def _render_icontains(self, op: Operator, field: str, value: Any) -> Dict[str, Any]:
+        lit = _escape_wildcard_literal(str(value))
+        return {"wildcard": {field: {"value": f"*{lit}*", "case_insensitive": True}}}
+
+    def _render_ends_with(self, op: Operator, field: str, value: Any) -> Dict[str, Any]:
+        lit = _escape_wildcard_literal(str(value))
+        return {"wildcard": {field: f"*{lit}"}}
+
+    def _render_prefix(self, op: Operator, field: str, value: Any) -> Dict[str, Any]:
+        return {"prefix": {field: value}}
+
+    def _render_ilike(self, op: Operator, field: str, value: Any) -> Dict[str, Any]:
+        wildcard = _like_to_wildcard_pattern(value)
+        return {"wildcard": {field: {"value": wildcard, "case_insensitive": True}}}
+
+    def _render_regexp(self, op: Operator, field: str, value: Any) -> Dict[str, Any]:
+        return {"regexp": {field: value}}
+
+    # Arrays
+
+    def _render_array_contains(
+        self, op: Operator, field: str, value: Any
+    ) -> Dict[str, Any]:
+        # For arrays of primitives, term matches any element.
+        return {"term": {field: value}}
+
+    def _render_array_contained(
+        self, op: Operator, field: str, value: Any
+    ) -> Dict[str, Any]:
+        # Ensure all elements of doc[field] are within the allowed list.
+        params = {"allowed": value, "f": field}
+        script_id = self._array_contained_script_id
+        if script_id is not None:
+            return {"script": {"script": {"id": script_id, "params": params}}}
+        return {
+            "script": {
                 "script": {
-                    "script": {
-                        "lang": "painless",
-                        "source": (
-                            "def vals = doc.containsKey(params.f) ? doc[params.f] : null; "
-                            "if (vals == null) return true; "
-                            "for (def v : vals) { if (!params.allowed.contains(v)) return false; } "
-                            "return true;"
-                        ),
-                        "params": {"allowed": value, "f": field},
-                    }
+                    "lang": "painless",
+                    "source": _ARRAY_CONTAINED_SOURCE,
+                    "params": params,
                 }
             }
+        }
 
-        # Geo
-        if op == Operator.GEO_WITHIN:
-            return {"geo_shape": {field: {"shape": value, "relation": "within"}}}
-        if op == Operator.GEO_INTERSECTS:
-            return {"geo_shape": {field: {"shape": value, "relation": "intersects"}}}
-
-        raise ValueError(f"Unsupported operator for Elasticsearch: {op}")
+    # Geo
+
+    def _render_geo(self, op: Operator, field: str, value: Any) -> Dict[str, Any]:
+        return {"geo_shape": {field: {"shape": value, "relation": _GEO_RELATIONS[op]}}}
+
+    # Negated operators never reach the table; see _NEGATED_OPERATORS.
+    _DISPATCH: ClassVar[
+        Dict[
+            Operator,
+            Callable[
+                ["ElasticsearchConditionTranslator", Operator, str, Any],
+                Dict[str, Any],
+            ],
+        ]
+    ] = {
+        Operator.EXISTS: _render_exists,
+        Operator.EQ: _render_term,
+        Operator.GT: _render_range,
+        Operator.GTE: _render_range,
+        Operator.LT: _render_range,
+        Operator.LTE: _render_range,
+        Operator.BETWEEN: _render_between,
+        Operator.IN: _render_terms,
+        Operator.CONTAINS: _render_contains,
+        Operator.ICONTAINS: _render_icontains,
+        Operator.ENDS_WITH: _render_ends_with,
+        Operator.STARTS_WITH: _render_prefix,
+        Operator.ILIKE: _render_ilike,
+        Operator.REGEX: _render_regexp,
+        Operator.ARRAY_CONTAINS: _render_array_contains,
+        Operator.ARRAY_OVERLAP: _render_terms,
+        Operator.ARRAY_CONTAINED: _render_array_contained,
+        Operator.GEO_WITHIN: _render_geo,
+        Operator.GEO_INTERSECTS: _render_geo,
+    }
 
     def visit_and(self, and_expr: AndExpression) -> Dict[str, Any]:
-        return {"bool": {"must": [expr.accept(self) for expr in and_expr.expressions]}}
+        return self.walk(and_expr)
 
     def visit_or(self, or_expr: OrExpression) -> Dict[str, Any]:
-        return {
-            "bool": {
-                "should": [expr.accept(self) for expr in or_expr.expressions],
-                "minimum_should_match": 1,
-            }
-        }
+        return self.walk(or_expr)
 
     def visit_not(self, not_expr: NotExpression) -> Dict[str, Any]:
-        return {"bool": {"must_not": [not_expr.expression.accept(self)]}}
+        return self.walk(not_expr)
+
+    def walk(self, root: FilterExpression) -> Dict[str, Any]:
+        """
+        Translate `root` bottom-up without recursing.
+
+        The stack holds nodes still to translate and (combiner, arity)
+        markers; a marker pops its children's clauses off `results` once
+        they are all done. Same-type And/Or children are flattened and
+        single-child nodes unwrapped on the way down.
+        """
+        results: List[Dict[str, Any]] = []
+        stack: List[Any] = [root]
+        pop = stack.pop
+        push = stack.append
+        while stack:
+            item = pop()
+            t = type(item)
+            if t is tuple:
+                combine, n = item
+                parts = results[-n:]
+                del results[-n:]
+                results.append(combine(parts))
+                continue
+            if t not in _FILTER_NODE_TYPES:
+                t = _node_type(item)
+            if t is Condition:
+                results.append(self.visit_condition(item))
+            elif t is AndExpression or t is OrExpression:
+                children = _flatten(t, item.expressions)
+                if len(children) == 1:
+                    push(children[0])
+                    continue
+                push(
+                    (_combine_and if t is AndExpression else _combine_or, len(children))
+                )
+                stack.extend(children[::-1])
+            elif t is NotExpression:
+                push((_combine_not, 1))
+                push(item.expression)
+            else:
+                results.append(item.accept(self))
+        return results[0]
+
+
+def _combine_and(parts: List[Dict[str, Any]]) -> Dict[str, Any]:
+    if any(_is_match_none(p) for p in parts):
+        return _match_none()
+    must, must_not = _split_negations([p for p in parts if not _is_match_all(p)])
+    must = _merge_ranges(must)
+    if not must and not must_not:
+        return _match_all()
+    if len(must) == 1 and not must_not:
+        return must[0]
+
+    bool_query: Dict[str, Any] = {}
+    if must:
+        bool_query["must"] = must
+    if must_not:
+        bool_query["must_not"] = must_not
+    return {"bool": bool_query}
+
+
+def _combine_or(parts: List[Dict[str, Any]]) -> Dict[str, Any]:
+    if any(_is_match_all(p) for p in parts):
+        return _match_all()
+    should = [p for p in parts if not _is_match_none(p)]
+    if not should:
+        return _match_none()
+    if len(should) == 1:
+        return should[0]
+    return {"bool": {"should": should, "minimum_should_match": 1}}
+
+
+def _combine_not(parts: List[Dict[str, Any]]) -> Dict[str, Any]:
+    (inner,) = parts
+    if _is_match_none(inner):
+        return _match_all()
+    if _is_match_all(inner):
+        return _match_none()
+    return {"bool": {"must_not": parts}}
+
+
+# The default visitor holds no per-query state, so translators without custom
+# configuration share one instance.
+_VISITOR = ElasticsearchConditionTranslator()
 
 
 class ElasticsearchTranslator(QueryTranslator):
-    """Elasticsearch translator for the UQLQuery model (no legacy formats)."""
+    """
+    Elasticsearch translator for the UQLQuery model (no legacy formats).
+
+    wildcard_fields: optional field names that have a "<field>.wildcard"
+    subfield mapped with the ES `wildcard` type. contains/ncontains/
+    icontains/ends_with/ilike/regex conditions on those fields query the
+    subfield, which is built for leading-wildcard and regexp matching.
 
-    def translate(self, uql: Dict[str, Any]) -> Dict[str, Any]:
-        try:
-            parsed = UQLQuery.model_validate(uql)
-        except ValidationError as e:
-            raise ValueError(f"Invalid UQL query: {e}") from e
+    array_contained_script_id: optional stored-script id. When set,
+    array_contained conditions reference that script instead of inlining
+    its Painless source; create it once with register_scripts().
+    """
+
+    __slots__ = ("_visitor",)
+
+    def __init__(
+        self,
+        wildcard_fields: Optional[Iterable[str]] = None,
+        array_contained_script_id: Optional[str] = None,
+    ) -> None:
+        self._visitor = (
+            ElasticsearchConditionTranslator(
+                wildcard_fields or (), array_contained_script_id
+            )
+            if wildcard_fields or array_contained_script_id
+            else _VISITOR
+        )
+
+    def _cache_token(self) -> Hashable:
+        visitor = self._visitor
+        return (
+            tuple(sorted(visitor._wildcard_fields)),
+            visitor._array_contained_script_id,
+        )
+
+    def register_scripts(self, es_client: Any) -> None:
+        """
+        Store the scripts this translator references on the cluster.
+
+        `es_client` is an `elasticsearch.Elasticsearch` client. Only needed
+        when array_contained_script_id is set; safe to call repeatedly.
+        """
+        script_id = self._visitor._array_contained_script_id
+        if script_id is None:
+            raise ValueError("array_contained_script_id is not configured")
+        es_client.put_script(
+            id=script_id,
+            script={"lang": "painless", "source": _ARRAY_CONTAINED_SOURCE},
+        )
+
+    def translate(self, uql: UQLInput) -> Dict[str, Any]:
+        key = self._plan_cache_key("dsl", uql)
+        if key is not None:
+            cached = _PLAN_CACHE.get(key)
+            if cached is not None:
+                # Stored serialized so every caller gets an independent dict.
+                return loads_json(cached)
+
+        out = self._translate_parsed(self._parse(uql))
+        if key is not None:
+            _PLAN_CACHE.put(key, dumps_json(out))
+        return out
 
+    def _translate_parsed(self, parsed: UQLQuery) -> Dict[str, Any]:
         out: Dict[str, Any] = {}
 
         # _source (projection)
-        if parsed.select and parsed.select != ["*"]:
-            out["_source"] = parsed.select
+        select = parsed.select
+        if select and select != ["*"]:
+            out["_source"] = list(select)
 
         # Pagination
         if parsed.limit is not None:
@@ -214,30 +556,79 @@ class ElasticsearchTranslator(QueryTranslator):
         # Sorting
         if parsed.orderBy:
             out["sort"] = [
-                {item.field: {"order": item.order.lower()}} for item in parsed.orderBy
+                {item.field: {"order": _SORT_ORDER[item.order]}}
+                for item in parsed.orderBy
             ]
 
         # Query
-        if parsed.where and (parsed.where.must or parsed.where.must_not):
-            visitor = ElasticsearchConditionTranslator()
-            bool_query: Dict[str, Any] = {}
-
-            if parsed.where.must:
-                bool_query["must"] = [
-                    expr.accept(visitor) for expr in parsed.where.must
-                ]
-
-            if parsed.where.must_not:
-                bool_query["must_not"] = [
-                    expr.accept(visitor) for expr in parsed.where.must_not
-                ]
-
-            out["query"] = {"bool": bool_query}
+        where = parsed.where
+        if where and (where.must or where.must_not):
+            out["query"] = self._build_query(where)
         else:
-            out["query"] = {"match_all": {}}
+            out["query"] = _match_all()
 
         return out
 
+    def _build_query(self, where: WhereClause) -> Dict[str, Any]:
+        # Constant clauses are folded here too: a match_none anywhere in must
+        # (or a match_all in must_not) empties the result, and the opposite
+        # constants are dropped. Nothing left means match_all.
+        visitor = self._visitor
+        bool_query: Dict[str, Any] = {}
+
+        must_not: List[Dict[str, Any]] = []
+        for expr in where.must_not or ():
+            clause = visitor.walk(expr)
+            if _is_match_all(clause):
+                return _match_none()
+            if not _is_match_none(clause):
+                must_not.append(clause)
+
+        if where.must:
+            scored: List[Dict[str, Any]] = []
+            filters: List[Dict[str, Any]] = []
+            for expr in where.must:
+                clause = visitor.walk(expr)
+                if _is_match_none(clause):
+                    return _match_none()
+                if _is_match_all(clause):
+                    continue
+                if (
+                    type(expr) is Condition
+                    and expr.operator in _FILTER_CONTEXT_OPERATORS
+                ):
+                    filters.append(clause)
+                else:
+                    scored.append(clause)
+
+            must, negated = _split_negations(scored)
+            if must:
+                bool_query["must"] = must
+            if filters:
+                bool_query["filter"] = _merge_ranges(filters)
+            must_not.extend(negated)
+
+        if must_not:
+            bool_query["must_not"] = must_not
+
+        if not bool_query:
+            return _match_all()
+        return {"bool": bool_query}
+
+    def translate_json(self, uql: UQLInput) -> bytes:
+        """Translate to a compact JSON request body (bytes)."""
+        # Shares the cache entry with translate(): the cached value is the body.
+        key = self._plan_cache_key("dsl", uql)
+        if key is not None:
+            cached = _PLAN_CACHE.get(key)
+            if cached is not None:
+                return cached
+
+        body = dumps_json(self._translate_parsed(self._parse(uql)))
+        if key is not None:
+            _PLAN_CACHE.put(key, body)
+        return body
+
 
 class ElasticsearchQueryBuilder:
     """Builder for constructing complex Elasticsearch queries with Where model."""
@@ -275,7 +666,7 @@ class ElasticsearchQueryBuilder:
 
     def build(self) -> Dict[str, Any]:
         """Build the complete Elasticsearch query."""
-        visitor = ElasticsearchConditionTranslator()
+        visitor = _VISITOR
         bool_query: Dict[str, Any] = {}
 
         if self.filter_expr:
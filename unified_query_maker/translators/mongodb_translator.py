@@ -1,22 +1,51 @@
 from __future__ import annotations
 
 import re
-from typing import Any, Dict
-
-from pydantic import ValidationError
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Callable, ClassVar, Dict, List, Mapping, Optional
 
 from unified_query_maker.models import UQLQuery
+from unified_query_maker.models.uql import WhereClause
 from unified_query_maker.models.where_model import (
     AndExpression,
     Condition,
+    FilterExpression,
     FilterVisitor,
     NotExpression,
     Operator,
     OrExpression,
+    _FILTER_NODE_TYPES,
+    _node_type,
+)
+from unified_query_maker.translators.base import _PLAN_CACHE, QueryTranslator, UQLInput
+from unified_query_maker.utils import copy_json, dumps_json, loads_json
+
+# Operators that map 1:1 onto a MongoDB query operator on the field.
+_MONGO_OPERATORS: Mapping[Operator, str] = MappingProxyType(
+    {
+        Operator.NEQ: "$ne",
+        Operator.GT: "$gt",
+        Operator.GTE: "$gte",
+        Operator.LT: "$lt",
+        Operator.LTE: "$lte",
+        Operator.IN: "$in",
+        Operator.NIN: "$nin",
+        Operator.ARRAY_OVERLAP: "$in",
+        Operator.GEO_WITHIN: "$geoWithin",
+        Operator.GEO_INTERSECTS: "$geoIntersects",
+    }
 )
-from unified_query_maker.translators.base import QueryTranslator
+
+# UQL sort direction -> pymongo direction (OrderByItem only admits ASC/DESC).
+_SORT_DIRECTION: Mapping[str, int] = MappingProxyType({"ASC": 1, "DESC": -1})
+
+
+# Literal patterns repeat across queries; memoize their escaped form.
+_escape_regex_literal = lru_cache(maxsize=4096)(re.escape)
 
 
+@lru_cache(maxsize=4096)
 def _sql_like_to_regex(pattern: str) -> str:
     """
     Convert SQL LIKE (% and _) to a safe regex body:
@@ -35,128 +64,313 @@ def _sql_like_to_regex(pattern: str) -> str:
     return "".join(out)
 
 
+# Rough per-document evaluation cost of a clause by its (first) query
+# operator. $and lists are stably sorted cheapest-first so that, when no
+# index applies, cheap selective predicates reject documents early.
+_OPERATOR_COST: Mapping[str, int] = MappingProxyType(
+    {
+        "$eq": 0,
+        "$ne": 1,
+        "$in": 1,
+        "$nin": 1,
+        "$gt": 2,
+        "$gte": 2,
+        "$lt": 2,
+        "$lte": 2,
+        "$exists": 3,
+        "$not": 6,
+        "$elemMatch": 6,
+        "$and": 7,
+        "$or": 7,
+        "$nor": 7,
+        "$regex": 8,
+        "$geoWithin": 9,
+        "$geoIntersects": 9,
+    }
+)
+_DEFAULT_COST = 5
+
+
+def _clause_cost(clause: Dict[str, Any]) -> int:
+    key = next(iter(clause))
+    if key[0] == "$":
+        return _OPERATOR_COST.get(key, _DEFAULT_COST)
+    value = clause[key]
+    if type(value) is dict and value:
+        return _OPERATOR_COST.get(next(iter(value)), _DEFAULT_COST)
+    # {field: literal} is an equality match.
+    return 0
+
+
+def _order_by_cost(clauses: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return sorted(clauses, key=_clause_cost)
+
+
+def _splice(key: str, clauses: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Inline clauses that are exactly {key: [...]} (same connective)."""
+    if not any(len(c) == 1 and key in c for c in clauses):
+        return clauses
+    out: List[Dict[str, Any]] = []
+    for c in clauses:
+        if len(c) == 1 and key in c:
+            out.extend(c[key])
+        else:
+            out.append(c)
+    return out
+
+
+def _merge_equalities(clauses: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """
+    Rewrite a disjunction of equality/$in matches on one field as one $in.
+
+    {"$or": [{f: 1}, {f: {"$in": [2, 3]}}]} -> {f: {"$in": [1, 2, 3]}}, which
+    the planner serves with a single index scan. Returns None when any clause
+    is something else.
+    """
+    field = None
+    values: List[Any] = []
+    for clause in clauses:
+        if len(clause) != 1:
+            return None
+        name = next(iter(clause))
+        value = clause[name]
+        if name[0] == "$" or (field is not None and name != field):
+            return None
+        field = name
+        if type(value) is dict:
+            # Operator documents: only a bare $in can be merged.
+            if len(value) != 1 or "$in" not in value:
+                return None
+            values.extend(value["$in"])
+        else:
+            values.append(value)
+    return {field: {"$in": values}}
+
+
 class MongoDBConditionTranslator(FilterVisitor[Dict[str, Any]]):
     """Visitor that translates Where-model expressions to MongoDB filter documents."""
 
+    __slots__ = ()
+
     def visit_condition(self, condition: Condition) -> Dict[str, Any]:
-        field = condition.field
         op = condition.operator
-        value = condition.value
-
-        # Existence
-        if op == Operator.EXISTS:
-            return {field: {"$exists": True, "$ne": None}}
-        if op == Operator.NEXISTS:
-            return {"$or": [{field: {"$exists": False}}, {field: None}]}
-
-        # Equality
-        if op == Operator.EQ:
-            return {field: value}
-        if op == Operator.NEQ:
-            return {field: {"$ne": value}}
-
-        # Comparisons / ranges
-        if op == Operator.GT:
-            return {field: {"$gt": value}}
-        if op == Operator.GTE:
-            return {field: {"$gte": value}}
-        if op == Operator.LT:
-            return {field: {"$lt": value}}
-        if op == Operator.LTE:
-            return {field: {"$lte": value}}
-        if op == Operator.BETWEEN:
-            if not isinstance(value, list) or len(value) != 2:
-                raise ValueError("BETWEEN expects a 2-item list value")
-            lo, hi = value
-            return {field: {"$gte": lo, "$lte": hi}}
-
-        # Membership
-        if op == Operator.IN:
-            return {field: {"$in": value}}
-        if op == Operator.NIN:
-            return {field: {"$nin": value}}
-
-        # Strings
-        if op == Operator.CONTAINS:
-            return {field: {"$regex": re.escape(str(value))}}
-        if op == Operator.NCONTAINS:
-            return {field: {"$not": {"$regex": re.escape(str(value))}}}
-        if op == Operator.ICONTAINS:
-            return {field: {"$regex": re.escape(str(value)), "$options": "i"}}
-        if op == Operator.STARTS_WITH:
-            return {field: {"$regex": f"^{re.escape(str(value))}"}}
-        if op == Operator.ENDS_WITH:
-            return {field: {"$regex": f"{re.escape(str(value))}$"}}
-        if op == Operator.ILIKE:
-            body = _sql_like_to_regex(str(value))
-            return {field: {"$regex": f"^{body}$", "$options": "i"}}
-        if op == Operator.REGEX:
-            return {field: {"$regex": str(value)}}
-
-        # Arrays
-        if op == Operator.ARRAY_CONTAINS:
-            return {field: value}
-        if op == Operator.ARRAY_OVERLAP:
-            return {field: {"$in": value}}
-        if op == Operator.ARRAY_CONTAINED:
-            return {field: {"$not": {"$elemMatch": {"$nin": value}}}}
-
-        # Geo
-        if op == Operator.GEO_WITHIN:
-            return {field: {"$geoWithin": {"$geometry": value}}}
-        if op == Operator.GEO_INTERSECTS:
-            return {field: {"$geoIntersects": {"$geometry": value}}}
-
-        raise ValueError(f"Unsupported operator for MongoDB: {op}")
+        handler = self._DISPATCH.get(op)
+        if handler is None:
+            raise ValueError(f"Unsupported operator for MongoDB: {op}")
+        # Copied so callers can mutate the output without touching the model.
+        return handler(self, op, condition.field, copy_json(condition.value))
+
+    # ---------- Operator handlers ----------
+
+    # Existence
+
+    def _render_exists(self, op: Operator, field: str, value: Any) -> Dict[str, Any]:
+        return {field: {"$exists": True, "$ne": None}}
+
+    def _render_nexists(self, op: Operator, field: str, value: Any) -> Dict[str, Any]:
+        return {"$or": [{field: {"$exists": False}}, {field: None}]}
+
+    # Equality / comparisons / membership
+
+    def _render_eq(self, op: Operator, field: str, value: Any) -> Dict[str, Any]:
+        return {field: value}
+
+    def _render_operator(self, op: Operator, field: str, value: Any) -> Dict[str, Any]:
+        return {field: {_MONGO_OPERATORS[op]: value}}
+
+    def _render_between(self, op: Operator, field: str, value: Any) -> Dict[str, Any]:
+        lo, hi = value
+        return {field: {"$gte": lo, "$lte": hi}}
+
+    # Strings
+
+    def _render_contains(self, op: Operator, field: str, value: Any) -> Dict[str, Any]:
+        return {field: {"$regex": _escape_regex_literal(str(value))}}
+
+    def _render_ncontains(self, op: Operator, field: str, value: Any) -> Dict[str, Any]:
+        return {field: {"$not": {"$regex": _escape_regex_literal(str(value))}}}
+
+    def _render_icontains(self, op: Operator, field: str, value: Any) -> Dict[str, Any]:
+        return {field: {"$regex": _escape_regex_literal(str(value)), "$options": "i"}}
+
+    def _render_starts_with(
+        self, op: Operator, field: str, value: Any
+    ) -> Dict[str, Any]:
+        return {field: {"$regex": f"^{_escape_regex_literal(str(value))}"}}
+
+    def _render_ends_with(self, op: Operator, field: str, value: Any) -> Dict[str, Any]:
+        return {field: {"$regex": f"{_escape_regex_literal(str(value))}$"}}
+
+    def _render_ilike(self, op: Operator, field: str, value: Any) -> Dict[str, Any]:
+        body = _sql_like_to_regex(str(value))
+        return {field: {"$regex": f"^{body}$", "$options": "i"}}
+
+    def _render_regex(self, op: Operator, field: str, value: Any) -> Dict[str, Any]:
+        return {field: {"$regex": str(value)}}
+
+    # Arrays
+
+    def _render_array_contained(
+        self, op: Operator, field: str, value: Any
+    ) -> Dict[str, Any]:
+        return {field: {"$not": {"$elemMatch": {"$nin": value}}}}
+
+    # Geo
+
+    def _render_geo(self, op: Operator, field: str, value: Any) -> Dict[str, Any]:
+        return {field: {_MONGO_OPERATORS[op]: {"$geometry": value}}}
+
+    _DISPATCH: ClassVar[
+        Dict[
+            Operator,
+            Callable[
+                ["MongoDBConditionTranslator", Operator, str, Any], Dict[str, Any]
+            ],
+        ]
+    ] = {
+        Operator.EXISTS: _render_exists,
+        Operator.NEXISTS: _render_nexists,
+        Operator.EQ: _render_eq,
+        Operator.NEQ: _render_operator,
+        Operator.GT: _render_operator,
+        Operator.GTE: _render_operator,
+        Operator.LT: _render_operator,
+        Operator.LTE: _render_operator,
+        Operator.BETWEEN: _render_between,
+        Operator.IN: _render_operator,
+        Operator.NIN: _render_operator,
+        Operator.CONTAINS: _render_contains,
+        Operator.NCONTAINS: _render_ncontains,
+        Operator.ICONTAINS: _render_icontains,
+        Operator.STARTS_WITH: _render_starts_with,
+        Operator.ENDS_WITH: _render_ends_with,
+        Operator.ILIKE: _render_ilike,
+        Operator.REGEX: _render_regex,
+        Operator.ARRAY_CONTAINS: _render_eq,
+        Operator.ARRAY_OVERLAP: _render_operator,
+        Operator.ARRAY_CONTAINED: _render_array_contained,
+        Operator.GEO_WITHIN: _render_geo,
+        Operator.GEO_INTERSECTS: _render_geo,
+    }
 
     def visit_and(self, and_expr: AndExpression) -> Dict[str, Any]:
-        return {"$and": [expr.accept(self) for expr in and_expr.expressions]}
+        return self.walk(and_expr)
 
     def visit_or(self, or_expr: OrExpression) -> Dict[str, Any]:
-        return {"$or": [expr.accept(self) for expr in or_expr.expressions]}
+        return self.walk(or_expr)
 
     def visit_not(self, not_expr: NotExpression) -> Dict[str, Any]:
-        return {"$nor": [not_expr.expression.accept(self)]}
+        return self.walk(not_expr)
+
+    def walk(self, root: FilterExpression) -> Dict[str, Any]:
+        """
+        Translate `root` bottom-up without recursing.
+
+        The stack holds nodes still to translate and (combiner, arity)
+        markers; a marker pops its children's documents off `results` once
+        they are all done. Single-child And/Or nodes and double negations
+        are unwrapped on the way down.
+        """
+        results: List[Dict[str, Any]] = []
+        stack: List[Any] = [root]
+        pop = stack.pop
+        push = stack.append
+        while stack:
+            item = pop()
+            t = type(item)
+            if t is tuple:
+                combine, n = item
+                parts = results[-n:]
+                del results[-n:]
+                results.append(combine(parts))
+                continue
+            if t not in _FILTER_NODE_TYPES:
+                t = _node_type(item)
+            if t is Condition:
+                results.append(self.visit_condition(item))
+            elif t is AndExpression or t is OrExpression:
+                children = item.expressions
+                if len(children) == 1:
+                    push(children[0])
+                    continue
+                push(
+                    (_combine_and if t is AndExpression else _combine_or, len(children))
+                )
+                stack.extend(children[::-1])
+            elif t is NotExpression:
+                inner = item.expression
+                if type(inner) is NotExpression:
+                    push(inner.expression)
+                    continue
+                push((_combine_not, 1))
+                push(inner)
+            else:
+                results.append(item.accept(self))
+        return results[0]
 
 
-class MongoDBTranslator(QueryTranslator):
-    """MongoDB translator for the UQLQuery model (no legacy formats)."""
+def _combine_and(parts: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return {"$and": _order_by_cost(_splice("$and", parts))}
 
-    def translate(self, uql: Dict[str, Any]) -> Dict[str, Any]:
-        try:
-            parsed = UQLQuery.model_validate(uql)
-        except ValidationError as e:
-            raise ValueError(f"Invalid UQL query: {e}") from e
 
-        visitor = MongoDBConditionTranslator()
-        query_filter: Dict[str, Any] = {}
+def _combine_or(parts: List[Dict[str, Any]]) -> Dict[str, Any]:
+    clauses = _splice("$or", parts)
+    return _merge_equalities(clauses) or {"$or": clauses}
 
-        if parsed.where:
-            parts: list[Dict[str, Any]] = []
 
-            if parsed.where.must:
-                parts.extend(expr.accept(visitor) for expr in parsed.where.must)
+def _combine_not(parts: List[Dict[str, Any]]) -> Dict[str, Any]:
+    # NOT (a OR b) is exactly $nor [a, b].
+    return {"$nor": _splice("$or", parts)}
 
-            if parsed.where.must_not:
-                parts.extend(
-                    NotExpression(expression=expr).accept(visitor)
-                    for expr in parsed.where.must_not
-                )
 
-            if len(parts) == 1:
-                query_filter = parts[0]
-            elif len(parts) > 1:
-                query_filter = {"$and": parts}
+# The visitor is stateless, so every translation shares one instance.
+_VISITOR = MongoDBConditionTranslator()
 
-        out: Dict[str, Any] = {"filter": query_filter}
 
-        if parsed.select and parsed.select != ["*"]:
-            out["projection"] = {f: 1 for f in parsed.select}
+class MongoDBTranslator(QueryTranslator):
+    """MongoDB translator for the UQLQuery model (no legacy formats)."""
+
+    def translate(self, uql: UQLInput) -> Dict[str, Any]:
+        key = self._plan_cache_key("mongo", uql)
+        if key is not None:
+            cached = _PLAN_CACHE.get(key)
+            if cached is not None:
+                # Stored serialized so every caller gets an independent dict;
+                # JSON has no tuples, so restore the (field, direction) pairs.
+                out = loads_json(cached)
+                if "sort" in out:
+                    out["sort"] = [tuple(item) for item in out["sort"]]
+                return out
+
+        out = self._translate_parsed(self._parse(uql))
+        if key is not None:
+            _PLAN_CACHE.put(key, dumps_json(out))
+        return out
+
+    def translate_json(self, uql: UQLInput) -> bytes:
+        """Translate to compact JSON (bytes); sort pairs become 2-item arrays."""
+        # Shares the cache entry with translate(): the cached value is the body.
+        key = self._plan_cache_key("mongo", uql)
+        if key is not None:
+            cached = _PLAN_CACHE.get(key)
+            if cached is not None:
+                return cached
+
+        body = dumps_json(self._translate_parsed(self._parse(uql)))
+        if key is not None:
+            _PLAN_CACHE.put(key, body)
+        return body
+
+    def _translate_parsed(self, parsed: UQLQuery) -> Dict[str, Any]:
+        out: Dict[str, Any] = {"filter": self._build_filter(parsed.where)}
+
+        select = parsed.select
+        if select and select != ["*"]:
+            out["projection"] = {f: 1 for f in select}
 
         if parsed.orderBy:
             out["sort"] = [
-                (item.field, 1 if item.order == "ASC" else -1)
-                for item in parsed.orderBy
+                (item.field, _SORT_DIRECTION[item.order]) for item in parsed.orderBy
             ]
 
         if parsed.limit is not None:
@@ -165,3 +379,31 @@ class MongoDBTranslator(QueryTranslator):
             out["skip"] = parsed.offset
 
         return out
+
+    def _build_filter(self, where: Optional[WhereClause]) -> Dict[str, Any]:
+        """The filter document for `where` ({} matches everything)."""
+        if not where:
+            return {}
+
+        visitor = _VISITOR
+        parts: List[Dict[str, Any]] = []
+
+        if where.must:
+            parts.extend(visitor.walk(expr) for expr in where.must)
+
+        if where.must_not:
+            # NOT a AND NOT b == $nor [a, b]: one clause, no NotExpression
+            # models built per query.
+            parts.append(
+                {
+                    "$nor": _splice(
+                        "$or", [visitor.walk(expr) for expr in where.must_not]
+                    )
+                }
+            )
+
+        if not parts:
+            return {}
+        if len(parts) == 1:
+            return parts[0]
+        return {"$and": _order_by_cost(_splice("$and", parts))}
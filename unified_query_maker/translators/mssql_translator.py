@@ -4,6 +4,10 @@ from .base_sql import SQLTranslator
 
 
 class MSSQLTranslator(SQLTranslator):
+    __slots__ = ()
+
+    _indexed_placeholders = False
+
     def _escape_identifier(self, identifier: str) -> str:
         return f"[{identifier}]"
 
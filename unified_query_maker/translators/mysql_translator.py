@@ -8,6 +8,8 @@ from .base_sql import SQLTranslator
 class MySQLTranslator(SQLTranslator):
     """MySQL specific translator"""
 
+    __slots__ = ()
+
     def _escape_identifier(self, identifier: str) -> str:
         return f"`{identifier}`"
 
@@ -6,6 +6,10 @@ from .base_sql import SQLTranslator
 class OracleTranslator(SQLTranslator):
     """Oracle specific translator."""
 
+    __slots__ = ()
+
+    _indexed_placeholders = True
+
     def _escape_identifier(self, identifier: str) -> str:
         """Escape identifiers with double quotes in Oracle."""
         return f'"{identifier}"'
@@ -6,12 +6,18 @@ from .base_sql import SQLTranslator
 class PostgreSQLTranslator(SQLTranslator):
     """PostgreSQL specific translator"""
 
+    __slots__ = ()
+
     def _escape_identifier(self, identifier: str) -> str:
         return f'"{identifier}"'
 
     def _escape_string(self, value: str) -> str:
         # PostgreSQL also uses backslash for escaping.
-        return value.replace("'", "''").replace("\\", "\\\\")
+        if "'" in value:
+            value = value.replace("'", "''")
+        if "\\" in value:
+            value = value.replace("\\", "\\\\")
+        return value
 
     def _render_ilike(self, field_sql: str, pattern: object) -> str:
         return f"{field_sql} ILIKE {self._value(pattern)} ESCAPE '\\\\'"
@@ -25,11 +31,16 @@ class PostgreSQLTranslator(SQLTranslator):
     def _render_array_overlap(self, field_sql: str, values: object) -> str:
         if not isinstance(values, list):
             raise ValueError("ARRAY_OVERLAP expects a list value")
-        array_literal = "ARRAY[" + ", ".join(self._value(v) for v in values) + "]"
-        return f"{field_sql} && {array_literal}"
+        return f"{field_sql} && {self._array_literal(values)}"
 
     def _render_array_contained(self, field_sql: str, values: object) -> str:
         if not isinstance(values, list):
             raise ValueError("ARRAY_CONTAINED expects a list value")
-        array_literal = "ARRAY[" + ", ".join(self._value(v) for v in values) + "]"
-        return f"{field_sql} <@ {array_literal}"
+        return f"{field_sql} <@ {self._array_literal(values)}"
+
+    def _array_literal(self, values: list) -> str:
+        # Literal-mode ID arrays: plain ints need no per-element dispatch.
+        if self._params is None and all(type(v) is int for v in values):
+            return "ARRAY[" + ", ".join(map(str, values)) + "]"
+        value = self._value
+        return "ARRAY[" + ", ".join([value(v) for v in values]) + "]"
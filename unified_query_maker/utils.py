@@ -1,13 +1,52 @@
 from __future__ import annotations
 
-import re
+import json
+from functools import lru_cache
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
 
 
 def escape_single_quotes(s: str) -> str:
     """Escape single quotes for SQL string literals by doubling them."""
+    if "'" not in s:
+        return s
     return s.replace("'", "''")
 
 
+def dumps_json(value: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes (uses orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def loads_json(data: bytes) -> Any:
+    """Inverse of dumps_json()."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+_JSON_CONTAINERS = frozenset({list, dict})
+
+
+def copy_json(value: Any) -> Any:
+    """Copy the lists/dicts of a JSON value; scalars are immutable and shared."""
+    t = type(value)
+    if t is list:
+        return [copy_json(v) if type(v) in _JSON_CONTAINERS else v for v in value]
+    if t is dict:
+        return {
+            k: copy_json(v) if type(v) in _JSON_CONTAINERS else v
+            for k, v in value.items()
+        }
+    return value
+
+
 def validate_qualified_name(
     name: str, *, allow_star: bool, allow_trailing_star: bool
 ) -> None:
@@ -22,7 +61,20 @@ def validate_qualified_name(
     Raises:
       ValueError on invalid input.
     """
-    raw = str(name).strip()
+    _validate_qualified_name(str(name), allow_star, allow_trailing_star)
+
+
+def _is_ident_segment(segment: str) -> bool:
+    # On ASCII text isidentifier() accepts exactly [A-Za-z_][A-Za-z0-9_]*.
+    return segment.isascii() and segment.isidentifier()
+
+
+# Only successful validations are memoized; invalid names raise every time.
+@lru_cache(maxsize=4096)
+def _validate_qualified_name(
+    name: str, allow_star: bool, allow_trailing_star: bool
+) -> None:
+    raw = name.strip()
 
     if raw == "*":
         if allow_star:
@@ -35,11 +87,11 @@ def validate_qualified_name(
             raise ValueError("Invalid qualified name")
         parts = base.split(".")
         for p in parts:
-            if not re.fullmatch(r"[A-Za-z_][A-Za-z0-9_]*", p):
+            if not _is_ident_segment(p):
                 raise ValueError(f"Invalid identifier segment: {p}")
         return
 
     parts = raw.split(".")
     for p in parts:
-        if not re.fullmatch(r"[A-Za-z_][A-Za-z0-9_]*", p):
+        if not _is_ident_segment(p):
             raise ValueError(f"Invalid identifier segment: {p}")
@@ -22,16 +22,18 @@ def validate_uql_semantics(uql: UQLQuery) -> bool:
         return False
 
 
-def _walk(expr: FilterExpression) -> None:
-    if isinstance(expr, Condition):
-        return
-    if isinstance(expr, AndExpression) or isinstance(expr, OrExpression):
-        if not expr.expressions:
-            raise ValueError("Boolean expression cannot be empty")
-        for sub in expr.expressions:
-            _walk(sub)
-        return
-    if isinstance(expr, NotExpression):
-        _walk(expr.expression)
-        return
-    raise ValueError(f"Unknown filter node: {type(expr)}")
+def _walk(root: FilterExpression) -> None:
+    # Explicit stack: arbitrarily deep filters cannot hit the recursion limit.
+    stack = [root]
+    while stack:
+        expr = stack.pop()
+        if isinstance(expr, Condition):
+            continue
+        if isinstance(expr, AndExpression) or isinstance(expr, OrExpression):
+            if not expr.expressions:
+                raise ValueError("Boolean expression cannot be empty")
+            stack.extend(expr.expressions)
+        elif isinstance(expr, NotExpression):
+            stack.append(expr.expression)
+        else:
+            raise ValueError(f"Unknown filter node: {type(expr)}")